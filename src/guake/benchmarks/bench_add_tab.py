@@ -0,0 +1,54 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+
+Times how long opening 1, 10, 50 and 100 tabs takes. Opening a tab
+should cost the same whatever the number of tabs already open, so
+the time per tab must stay flat across the rows.
+
+    cd src && xvfb-run -a python -m guake.benchmarks.bench_add_tab
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from guake.benchmarks.helpers import create_guake
+from guake.benchmarks.helpers import print_report
+from guake.benchmarks.helpers import reset_tabs
+from guake.benchmarks.helpers import timeit
+
+TAB_COUNTS = [1, 10, 50, 100]
+
+
+def open_tabs(guake, count):
+    for _ in range(count):
+        guake.add_tab()
+
+
+def main():
+    guake = create_guake()
+    rows = []
+    for count in TAB_COUNTS:
+        reset_tabs(guake)
+        elapsed = timeit(open_tabs, guake, count)
+        rows.append((count, '%.1f' % (elapsed * 1000), '%.2f' % (elapsed * 1000 / count)))
+    print_report('Guake.add_tab', ('tabs', 'total (ms)', 'per tab (ms)'), rows)
+
+
+if __name__ == '__main__':
+    main()
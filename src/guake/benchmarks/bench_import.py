@@ -0,0 +1,101 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+
+Reports the time spent importing each module when importing
+guake.main, or the module given on the command line, in the spirit of
+python3 -X importtime. Each run happens in a fresh interpreter so
+nothing is already imported:
+
+    cd src && python -m guake.benchmarks.bench_import [module]
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import __builtin__
+import subprocess
+import sys
+import time
+
+MODULE = 'guake.main'
+RUNS = 5
+
+
+def timed_import(module):
+    """Imports `module' and returns a (depth, name, self, cumulative)
+    tuple, in seconds, for each module it loaded. Like with importtime,
+    nested imports are listed before the one that triggered them.
+    """
+    original_import = __builtin__.__import__
+    records = []
+    # time spent in the imports done by each import being run
+    children = []
+
+    def timing_import(name, *args, **kwargs):
+        known = name in sys.modules
+        depth = len(children)
+        children.append(0.0)
+        start = time.time()
+        try:
+            return original_import(name, *args, **kwargs)
+        finally:
+            elapsed = time.time() - start
+            nested = children.pop()
+            if children:
+                children[-1] += elapsed
+            if not known:
+                records.append((depth, name, elapsed - nested, elapsed))
+
+    __builtin__.__import__ = timing_import
+    try:
+        __import__(module)
+    finally:
+        __builtin__.__import__ = original_import
+    return records
+
+
+def run_child(module):
+    for depth, name, self_time, cumulative in timed_import(module):
+        print('%d\t%s\t%f\t%f' % (depth, name, self_time, cumulative))
+
+
+def main():
+    module = sys.argv[1] if len(sys.argv) > 1 else MODULE
+    totals = []
+    for _ in range(RUNS):
+        output = subprocess.check_output([sys.executable, '-m', 'guake.benchmarks.bench_import',
+                                          '--child', module])
+        records = [line.split('\t') for line in output.splitlines()]
+        totals.append(sum(float(r[3]) for r in records if r[0] == '0'))
+
+    print('import time: self [us] | cumulative | imported package')
+    for depth, name, self_time, cumulative in records:
+        print('import time: %9d | %10d | %s%s' % (float(self_time) * 1e6, float(cumulative) * 1e6,
+                                                  '  ' * int(depth), name))
+    print()
+    totals.sort()
+    print('%s imported in %.1f ms (best of %d), %.1f ms median' % (
+        module, totals[0] * 1000, RUNS, totals[RUNS // 2] * 1000))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == '--child':
+        run_child(sys.argv[2])
+    else:
+        main()
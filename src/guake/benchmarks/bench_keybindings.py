@@ -0,0 +1,94 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+
+Times the startup of GConfKeyHandler alone, with a fake Guake object
+instead of the real window, and counts the accelerator_parse calls it
+needs to build the accel group.
+
+    cd src && xvfb-run -a python -m guake.benchmarks.bench_keybindings
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gtk
+import time
+
+from guake.benchmarks.helpers import print_report
+from guake.gconfhandler import GConfKeyHandler
+
+RUNS = 20
+
+
+class FakeHotkeys(object):
+
+    def bind(self, key, callback):
+        return True
+
+    def unbind(self, key):
+        pass
+
+
+class FakeGuake(object):
+
+    """Just enough of Guake for GConfKeyHandler to bind its keys.
+    """
+
+    def __init__(self):
+        self.window = gtk.Window()
+        self.context_menu = gtk.Menu()
+        self.hotkeys = FakeHotkeys()
+
+    def accel_noop(self, *args):
+        return True
+
+    def gen_accel_switch_tabN(self, N):
+        return self.accel_noop
+
+    def __getattr__(self, name):
+        return self.accel_noop
+
+
+def main():
+    parse_calls = [0]
+    accelerator_parse = gtk.accelerator_parse
+
+    def counting_accelerator_parse(accel):
+        parse_calls[0] += 1
+        return accelerator_parse(accel)
+    gtk.accelerator_parse = counting_accelerator_parse
+
+    timings = []
+    for _ in range(RUNS):
+        guake = FakeGuake()
+        start = time.time()
+        GConfKeyHandler(guake)
+        timings.append(time.time() - start)
+    gtk.accelerator_parse = accelerator_parse
+
+    timings.sort()
+    print_report('GConfKeyHandler startup (%d runs)' % RUNS,
+                 ('min (ms)', 'median (ms)', 'parse calls'),
+                 [('%.2f' % (timings[0] * 1000),
+                   '%.2f' % (timings[len(timings) // 2] * 1000),
+                   parse_calls[0] // RUNS)])
+
+
+if __name__ == '__main__':
+    main()
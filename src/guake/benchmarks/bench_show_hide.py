@@ -0,0 +1,107 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+
+Drives a running guake through D-Bus, showing and hiding it and
+opening and closing tabs, then prints the latencies guake recorded
+itself. It also sets the background transparency many times in a row,
+like a dragged slider, and prints how many of these gconf
+notifications were coalesced. Guake is started with GUAKE_PERF=1 if it is not running yet:
+
+    cd src && xvfb-run -a dbus-launch python -m guake.benchmarks.bench_show_hide [runs]
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import dbus
+import gconf
+import os
+import subprocess
+import sys
+import time
+
+from guake.benchmarks.helpers import print_report
+from guake.globals import DBUS_NAME
+from guake.globals import DBUS_PATH
+from guake.globals import KEY
+
+RUNS = 100
+STARTUP_TIMEOUT = 30
+# transparency values set for each run, as a dragged slider would
+SLIDER_STEPS = 20
+
+
+def get_remote_object(bus):
+    if not bus.name_has_owner(DBUS_NAME):
+        env = dict(os.environ, GUAKE_PERF='1')
+        subprocess.Popen([sys.executable, '-m', 'guake.main'], env=env)
+        deadline = time.time() + STARTUP_TIMEOUT
+        while not bus.name_has_owner(DBUS_NAME):
+            if time.time() > deadline:
+                sys.exit("guake did not show up on the session bus")
+            time.sleep(0.1)
+    return bus.get_object(DBUS_NAME, DBUS_PATH)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    remote_object = get_remote_object(dbus.SessionBus())
+    remote_object.reset_perf_stats()
+
+    for _ in range(runs):
+        remote_object.show()
+        remote_object.hide()
+        remote_object.show_hide()
+        remote_object.show_hide()
+        remote_object.add_tab('')
+        # the new tab is the last one, closing it keeps the tab count
+        # steady between the runs
+        remote_object.delete_tab(remote_object.get_tab_count() - 1)
+    # let the idle callbacks measuring the frames run
+    time.sleep(0.5)
+
+    client = gconf.client_get_default()
+    transparency_key = KEY('/style/background/transparency')
+    transparency = client.get_int(transparency_key)
+    before = remote_object.get_dispatcher_stats()
+    for _ in range(runs):
+        for step in range(SLIDER_STEPS):
+            client.set_int(transparency_key, step * 100 // SLIDER_STEPS)
+    client.set_int(transparency_key, transparency)
+    time.sleep(0.5)
+    after = remote_object.get_dispatcher_stats()
+
+    stats = remote_object.get_perf_stats()
+    if not stats:
+        sys.exit("No timing recorded, is guake running with GUAKE_PERF=1?")
+    rows = []
+    for name in sorted(stats):
+        values = stats[name]
+        rows.append((name, int(values['count']), '%.2f' % values['p50'],
+                     '%.2f' % values['p95'], '%.2f' % values['max']))
+    print_report('Guake latencies over %d runs' % runs,
+                 ('operation', 'samples', 'p50 (ms)', 'p95 (ms)', 'max (ms)'), rows)
+    print_report('gconf notifications over %d slider drags' % runs,
+                 ('coalesced', 'dispatched'),
+                 [(after['coalesced'] - before['coalesced'],
+                   after['dispatched'] - before['dispatched'])])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+
+
+Times Guake.recompute_tabs_titles with 100 tabs open, when every title
+must be computed again (the abbreviation changed) and when nothing
+changed and the cached titles are used:
+
+    cd src && xvfb-run -a python -m guake.benchmarks.bench_tab_titles [runs]
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+
+from guake.benchmarks.helpers import create_guake
+from guake.benchmarks.helpers import print_report
+from guake.benchmarks.helpers import reset_tabs
+from guake.benchmarks.helpers import timeit
+from guake.globals import KEY
+
+TAB_COUNT = 100
+RUNS = 20
+
+
+def recompute_all(guake):
+    guake.abbreviate = not guake.abbreviate
+    guake.recompute_tabs_titles()
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS
+    guake = create_guake()
+    # only in memory, the user configuration is left alone
+    guake.settings.update(KEY('/general/use_vte_titles'), True)
+    reset_tabs(guake)
+    for _ in range(TAB_COUNT - 1):
+        guake.add_tab()
+
+    rows = []
+    for name, func in (('invalidated', recompute_all),
+                       ('cached', lambda guake: guake.recompute_tabs_titles())):
+        func(guake)
+        elapsed = sum(timeit(func, guake) for _ in range(runs)) / runs
+        rows.append((name, TAB_COUNT, '%.2f' % (elapsed * 1000),
+                     '%.3f' % (elapsed * 1000 / TAB_COUNT)))
+    print_report('Guake.recompute_tabs_titles over %d runs' % runs,
+                 ('titles', 'tabs', 'total (ms)', 'per tab (ms)'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gtk
+import time
+
+
+def create_guake():
+    """Builds a real Guake instance. A X display and the guake gconf
+    schemas are required, use xvfb-run on headless machines.
+    """
+    from guake.guake_app import Guake
+    guake = Guake()
+    # never block a benchmark on a "are you sure" dialog
+    guake.run_quit_dialog = lambda *args: True
+    process_events()
+    return guake
+
+
+def process_events():
+    """Runs the main loop until there is nothing left to do, so idle
+    callbacks are accounted in the measured time.
+    """
+    while gtk.events_pending():
+        gtk.main_iteration(False)
+
+
+def reset_tabs(guake):
+    """Closes every tab but the first one.
+    """
+    while guake.notebook.get_tab_count() > 1:
+        guake.delete_tab(guake.notebook.get_tab_count() - 1)
+    process_events()
+
+
+def timeit(func, *args, **kwargs):
+    """Returns the time in seconds taken by func(*args, **kwargs) and
+    by the main loop iterations it triggered.
+    """
+    start = time.time()
+    func(*args, **kwargs)
+    process_events()
+    return time.time() - start
+
+
+def print_report(title, header, rows):
+    print(title)
+    print('=' * len(title))
+    print(''.join('%-16s' % h for h in header))
+    for row in rows:
+        print(''.join('%-16s' % c for c in row))
+    print()
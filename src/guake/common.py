@@ -19,6 +19,8 @@ Boston, MA 02110-1301 USA
 """
 from __future__ import absolute_import
 
+import bisect
+import importlib
 import os
 import sys
 
@@ -27,12 +29,15 @@ import gettext
 import gtk
 import guake.globals
 
+from guake.palettes import parse_palette
+
 # Internationalization purposes.
 _ = gettext.gettext
 
 __all__ = ['_', 'ShowableError', 'test_gconf',
            'pixmapfile', 'gladefile', 'hexify_color',
-           'get_binaries_from_path']
+           'get_binaries_from_path', 'get_executable_index', 'get_palette_colors',
+           'lazy_import']
 
 
 class ShowableError(Exception):
@@ -48,6 +53,30 @@ class ShowableError(Exception):
             sys.exit(exit_code)
 
 
+class LazyModule(object):
+
+    """Stands for a module that is only imported when one of its
+    attributes is first used.
+    """
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def __getattr__(self, attr):
+        module = self.__dict__['_module']
+        if module is None:
+            module = self.__dict__['_module'] = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    """Returns a placeholder for the module `name', to keep modules
+    that are not needed to start guake out of the startup path.
+    """
+    return LazyModule(name)
+
+
 def test_gconf():
     c = gconf.client_get_default()
     return c.dir_exists('/apps/guake')
@@ -72,14 +101,96 @@ def hexify_color(c):
     return '#%s%s%s' % (h(c.red), h(c.green), h(c.blue))
 
 
+# palette string -> tuple of gtk.gdk.Color, only a few palettes are
+# ever used in a session so the cache is simply emptied when full
+_palette_colors = {}
+PALETTE_COLORS_CACHE_SIZE = 16
+
+
+def get_palette_colors(palette):
+    """Returns the colors of a colon separated palette string as
+    gtk.gdk.Color objects. They are built once per palette string and
+    shared, so they must not be modified.
+    """
+    colors = _palette_colors.get(palette)
+    if colors is None:
+        try:
+            colors = tuple(gtk.gdk.Color(*rgb) for rgb in parse_palette(palette))
+        except ValueError:
+            # not written by guake, let gtk deal with the color names
+            colors = tuple(gtk.gdk.color_parse(spec) for spec in palette.split(':'))
+        if len(_palette_colors) >= PALETTE_COLORS_CACHE_SIZE:
+            _palette_colors.clear()
+        _palette_colors[palette] = colors
+    return colors
+
+
+class ExecutableIndex(object):
+
+    """Index of the file names found in the $PATH directories. A
+    directory is listed again only when its mtime changed, so lookups
+    do not rescan the whole $PATH each time.
+    """
+
+    def __init__(self):
+        # directory -> (mtime, sorted file names)
+        self.directories = {}
+
+    def list_directory(self, directory):
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return []
+        cached = self.directories.get(directory)
+        if cached is None or cached[0] != mtime:
+            try:
+                names = sorted(os.listdir(directory))
+            except OSError:
+                names = []
+            cached = self.directories[directory] = (mtime, names)
+        return cached[1]
+
+    def iter_path(self):
+        for directory in os.environ.get('PATH', '').split(os.pathsep):
+            if directory:
+                yield directory, self.list_directory(directory)
+
+    def search(self, compiled_re):
+        """Returns the full path of the files whose name matches the
+        compiled regular expression `compiled_re'.
+        """
+        return [os.path.join(directory, name)
+                for directory, names in self.iter_path()
+                for name in names
+                if compiled_re.match(name)]
+
+    def search_prefix(self, prefix):
+        """Returns the full path of the files whose name starts with
+        `prefix'.
+        """
+        ret = []
+        for directory, names in self.iter_path():
+            i = bisect.bisect_left(names, prefix)
+            while i < len(names) and names[i].startswith(prefix):
+                ret.append(os.path.join(directory, names[i]))
+                i += 1
+        return ret
+
+
+_executable_index = None
+
+
+def get_executable_index():
+    """Returns the shared ExecutableIndex instance.
+    """
+    global _executable_index
+    if _executable_index is None:
+        _executable_index = ExecutableIndex()
+    return _executable_index
+
+
 def get_binaries_from_path(compiled_re):
-    ret = []
-    for i in os.environ.get('PATH', '').split(os.pathsep):
-        if os.path.isdir(i):
-            for j in os.listdir(i):
-                if compiled_re.match(j):
-                    ret.append(os.path.join(i, j))
-    return ret
+    return get_executable_index().search(compiled_re)
 
 
 def shell_quote(text):
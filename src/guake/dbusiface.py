@@ -22,12 +22,27 @@ from __future__ import absolute_import
 import dbus
 import dbus.glib
 import dbus.service
+import gobject
 
+from guake.globals import DBUS_NAME
+from guake.globals import DBUS_PATH
+from guake.perf import get_recorder
+from guake.reaper import get_shell_reaper
+from guake.terminal import get_style_stats
 
 dbus.glib.threads_init()
 
-DBUS_PATH = '/org/guake/RemoteControl'
-DBUS_NAME = 'org.guake.RemoteControl'
+# Methods that can be called through DbusManager.batch()
+BATCH_OPERATIONS = (
+    'add_tab', 'delete_tab', 'select_tab', 'get_selected_tab', 'get_tab_count',
+    'set_bgcolor', 'set_fgcolor', 'execute_command', 'execute_command_by_uuid',
+    'get_tab_name', 'rename_tab_uuid', 'rename_tab', 'rename_current_tab',
+    'get_selected_uuidtab', 'show', 'hide', 'fullscreen',
+)
+
+# Title changes are sent at most once per interval for each tab, so a
+# program updating its title in a loop does not flood the bus
+TITLE_SIGNAL_INTERVAL = 250  # ms
 
 
 class DbusManager(dbus.service.Object):
@@ -38,6 +53,114 @@ class DbusManager(dbus.service.Object):
         bus_name = dbus.service.BusName(DBUS_NAME, bus=self.bus)
         super(DbusManager, self).__init__(bus_name, DBUS_PATH)
 
+        # tab uuid -> last title sent, and titles waiting for the timer
+        self.titles = {}
+        self.pending_titles = {}
+        self.title_source_id = None
+
+        notebook = self.guake.notebook
+        notebook.connect('page-added', self.on_page_added)
+        notebook.connect('page-removed', self.on_page_removed)
+        notebook.connect('switch-page', self.on_switch_page)
+        self.guake.window.connect('show', self.on_window_shown)
+        self.guake.window.connect('hide', self.on_window_hidden)
+        for terminal in notebook.iter_terminals():
+            self.watch_terminal(terminal)
+
+    # -- signals --
+
+    @dbus.service.signal(DBUS_NAME, signature='s')
+    def tab_added(self, tab_uuid):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='s')
+    def tab_removed(self, tab_uuid):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='ss')
+    def tab_renamed(self, tab_uuid, title):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='ss')
+    def tab_title_changed(self, tab_uuid, title):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='s')
+    def tab_selected(self, tab_uuid):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='s')
+    def shown(self, tab_uuid):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='s')
+    def hidden(self, tab_uuid):
+        pass
+
+    @dbus.service.signal(DBUS_NAME, signature='si')
+    def child_exited(self, tab_uuid, status):
+        pass
+
+    def watch_terminal(self, terminal):
+        terminal.connect('window-title-changed', self.on_terminal_title_changed)
+        terminal.connect('child-exited', self.on_terminal_child_exited)
+
+    def get_current_uuid(self):
+        terminal = self.guake.notebook.get_current_terminal()
+        return str(terminal.get_uuid()) if terminal is not None else ''
+
+    def on_page_added(self, notebook, box, page_num):
+        self.watch_terminal(box.terminal)
+        self.tab_added(str(box.terminal.get_uuid()))
+
+    def on_page_removed(self, notebook, box, page_num):
+        tab_uuid = str(box.terminal.get_uuid())
+        self.titles.pop(tab_uuid, None)
+        self.pending_titles.pop(tab_uuid, None)
+        self.tab_removed(tab_uuid)
+
+    def on_switch_page(self, notebook, page, page_num):
+        self.tab_selected(str(notebook.get_nth_page(page_num).terminal.get_uuid()))
+
+    def on_window_shown(self, window):
+        self.shown(self.get_current_uuid())
+
+    def on_window_hidden(self, window):
+        self.hidden(self.get_current_uuid())
+
+    def on_terminal_child_exited(self, terminal):
+        self.child_exited(str(terminal.get_uuid()), terminal.get_child_exit_status())
+
+    def on_terminal_title_changed(self, terminal):
+        """Queues the new label of the tab. Guake's own handler ran
+        before and already updated it, renaming a tab goes through
+        here too.
+        """
+        tab = self.guake.notebook.get_tab_by_uuid(terminal.get_uuid())
+        if tab is None:
+            return
+        tab_uuid = str(tab.uuid)
+        title = tab.button.get_label()
+        if self.titles.get(tab_uuid) == title:
+            return
+        self.titles[tab_uuid] = title
+        self.pending_titles[tab_uuid] = (tab.custom_label is not None, title)
+        if self.title_source_id is None:
+            self.title_source_id = gobject.timeout_add(TITLE_SIGNAL_INTERVAL,
+                                                       self.send_titles)
+
+    def send_titles(self):
+        self.title_source_id = None
+        pending, self.pending_titles = self.pending_titles, {}
+        for tab_uuid, (renamed, title) in pending.items():
+            if renamed:
+                self.tab_renamed(tab_uuid, title)
+            else:
+                self.tab_title_changed(tab_uuid, title)
+        return False
+
+    # -- methods --
+
     @dbus.service.method(DBUS_NAME)
     def show_hide(self):
         self.guake.show_hide()
@@ -68,6 +191,10 @@ class DbusManager(dbus.service.Object):
     def add_tab(self, directory=''):
         return self.guake.add_tab(directory)
 
+    @dbus.service.method(DBUS_NAME, in_signature='i')
+    def delete_tab(self, tab_index):
+        self.guake.delete_tab(int(tab_index))
+
     @dbus.service.method(DBUS_NAME, in_signature='i')
     def select_tab(self, tab_index=0):
         return self.guake.select_tab(int(tab_index))
@@ -78,7 +205,7 @@ class DbusManager(dbus.service.Object):
 
     @dbus.service.method(DBUS_NAME, out_signature='i')
     def get_tab_count(self):
-        return len(self.guake.notebook.term_list)
+        return self.guake.notebook.get_tab_count()
 
     @dbus.service.method(DBUS_NAME, in_signature='s')
     def set_bgcolor(self, bgcolor):
@@ -94,7 +221,7 @@ class DbusManager(dbus.service.Object):
 
     @dbus.service.method(DBUS_NAME, in_signature='i', out_signature='s')
     def get_tab_name(self, tab_index=0):
-        return self.guake.notebook.term_list[int(tab_index)].get_window_title() or ''
+        return self.guake.notebook.get_tab(int(tab_index)).terminal.get_window_title() or ''
 
     @dbus.service.method(DBUS_NAME, in_signature='ss')
     def rename_tab_uuid(self, tab_uuid, new_text):
@@ -122,7 +249,7 @@ class DbusManager(dbus.service.Object):
 
     @dbus.service.method(DBUS_NAME, in_signature='i', out_signature='s')
     def get_gtktab_name(self, tab_index=0):
-        return self.guake.tabs.get_children()[tab_index].get_label()
+        return self.guake.notebook.get_tab(tab_index).button.get_label()
 
     @dbus.service.method(DBUS_NAME, out_signature='s')
     def get_selected_uuidtab(self):
@@ -131,3 +258,47 @@ class DbusManager(dbus.service.Object):
     @dbus.service.method(DBUS_NAME, in_signature='ss')
     def execute_command_by_uuid(self, tab_uuid, command):
         self.guake.execute_command_by_uuid(tab_uuid, command)
+
+    @dbus.service.method(DBUS_NAME, out_signature='a{sa{sd}}')
+    def get_perf_stats(self):
+        return get_recorder().get_stats()
+
+    @dbus.service.method(DBUS_NAME)
+    def reset_perf_stats(self):
+        get_recorder().reset()
+
+    @dbus.service.method(DBUS_NAME, out_signature='a{si}')
+    def get_style_stats(self):
+        return get_style_stats()
+
+    @dbus.service.method(DBUS_NAME, out_signature='a{si}')
+    def get_shell_pool_stats(self):
+        return self.guake.shell_pool.get_stats()
+
+    @dbus.service.method(DBUS_NAME, out_signature='a{si}')
+    def get_dispatcher_stats(self):
+        return self.guake.gconf_handler.dispatcher.get_stats()
+
+    @dbus.service.method(DBUS_NAME, out_signature='i')
+    def get_closing_shell_count(self):
+        return get_shell_reaper().get_pending_count()
+
+    @dbus.service.method(DBUS_NAME, in_signature='a(sav)', out_signature='as')
+    def batch(self, operations):
+        """Runs a list of (method name, arguments) pairs in a single
+        call and returns the result of each one as a string, empty
+        when the method returns nothing. add_tab selects the tab it
+        creates, so a layout is built by following each add_tab with
+        rename_current_tab or execute_command. The operations are
+        checked before any is run.
+        """
+        for name, args in operations:
+            if name not in BATCH_OPERATIONS:
+                raise dbus.DBusException('Unsupported batch operation: %s' % name)
+
+        results = []
+        for name, args in operations:
+            result = getattr(self, name)(*args)
+            results.append('' if result is None else unicode(result))
+
+        return results
@@ -0,0 +1,169 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gconf
+import gtk
+import logging
+import os
+import subprocess
+
+from guake.common import lazy_import
+from guake.fonts import DCONF_USER_DB
+from guake.globals import KEY
+
+try:
+    import gio
+except ImportError:
+    gio = None
+
+__all__ = ['DisplayGeometry']
+
+UNITY_DCONF_PATH = '/org/compiz/profiles/unity/plugins/unityshell/'
+UNITY_GCONF_PATH = KEY('/apps/compiz-1/plugins/unityshell/screen0/options/')
+
+log = logging.getLogger(__name__)
+
+# only needed once, the first time the window is shown on Ubuntu
+platform = lazy_import('platform')
+
+
+class DisplayGeometry(object):
+
+    """Caches what is needed to place the main window: the geometry of
+    each monitor and the width taken by the Unity launcher. Finding
+    the later means parsing the distribution files and forking dconf,
+    so it must not be done each time the window is shown.
+
+    The monitors are forgotten when the screen emits monitors-changed
+    or size-changed, the launcher width when the unity settings change.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.monitors = {}
+        self.n_monitors = None
+        self.primary_monitor = None
+        self.unity = None
+        self.ubuntu_version = None
+        self.unity_dock = None
+        self.monitor = None
+
+        screen.connect('monitors-changed', self.invalidate)
+        screen.connect('size-changed', self.invalidate)
+
+        client = gconf.client_get_default()
+        client.notify_add(UNITY_GCONF_PATH + 'launcher_hide_mode', self.invalidate_dock)
+        client.notify_add(UNITY_GCONF_PATH + 'icon_size', self.invalidate_dock)
+        if gio is not None and os.path.exists(DCONF_USER_DB):
+            self.monitor = gio.File(DCONF_USER_DB).monitor_file()
+            self.monitor.connect('changed', self.invalidate_dock)
+
+    def invalidate(self, *args):
+        log.debug("Monitors changed, forgetting their geometry")
+        self.monitors = {}
+        self.n_monitors = None
+        self.primary_monitor = None
+
+    def invalidate_dock(self, *args):
+        self.unity_dock = None
+
+    def get_n_monitors(self):
+        if self.n_monitors is None:
+            self.n_monitors = self.screen.get_n_monitors()
+        return self.n_monitors
+
+    def get_primary_monitor(self):
+        if self.primary_monitor is None:
+            self.primary_monitor = self.screen.get_primary_monitor()
+        return self.primary_monitor
+
+    def get_monitor_geometry(self, monitor):
+        """Returns a copy of the geometry of `monitor', callers are free
+        to modify it.
+        """
+        geometry = self.monitors.get(monitor)
+        if geometry is None:
+            geometry = self.monitors[monitor] = self.screen.get_monitor_geometry(monitor)
+        return gtk.gdk.Rectangle(geometry.x, geometry.y, geometry.width, geometry.height)
+
+    def is_using_unity(self):
+        if self.unity is None:
+            self.unity = self.read_is_using_unity()
+        return self.unity
+
+    def read_is_using_unity(self):
+        linux_distrib = platform.linux_distribution()
+        if linux_distrib[0].lower() != "ubuntu":
+            return False
+        self.ubuntu_version = float(linux_distrib[1])
+
+        # http://askubuntu.com/questions/70296
+        if self.ubuntu_version - 0.01 < 11.10:
+            if os.environ.get('DESKTOP_SESSION', '').lower() == "gnome".lower():
+                return True
+        else:
+            if os.environ.get('XDG_CURRENT_DESKTOP', '').lower() == "unity".lower():
+                return True
+        return False
+
+    def get_unity_dock_width(self):
+        """Returns the width taken by the Unity launcher on the left of
+        the screen, 0 when Unity is not used or the launcher hides
+        itself.
+        """
+        if not self.is_using_unity():
+            return 0
+        if self.unity_dock is None:
+            self.unity_dock = self.read_unity_dock_width()
+        return self.unity_dock
+
+    def read_unity_dock_width(self):
+        # For Ubuntu 12.10 and above, try to use dconf:
+        # see if unity dock is hiden => unity_hide
+        # and the width of unity dock. => unity_dock
+        found = False
+        unity_hide = 0
+        # float() conversion might mess things up. Add 0.01 so the comparison will always be
+        # valid, even in case of float("10.10") = 10.099999999999999
+        if self.ubuntu_version + 0.01 >= 12.10:
+            try:
+                unity_hide = int(subprocess.check_output(
+                    ['/usr/bin/dconf', 'read', UNITY_DCONF_PATH + 'launcher-hide-mode']))
+                unity_dock = int(subprocess.check_output(
+                    ['/usr/bin/dconf', 'read', UNITY_DCONF_PATH + 'icon-size']) or "48")
+                found = True
+            except:
+                # in case of error, just ignore it, 'found' will not be set to True and so
+                # we execute the fallback
+                pass
+        if not found:
+            # Fallback: try to bet from gconf
+            client = gconf.client_get_default()
+            unity_hide = client.get_int(UNITY_GCONF_PATH + 'launcher_hide_mode')
+            unity_icon_size = client.get_int(UNITY_GCONF_PATH + 'icon_size')
+            unity_dock = unity_icon_size + 17
+
+        # launcher_hide_mode = 1 => autohide
+        if unity_hide == 1:
+            return 0
+        return unity_dock
@@ -0,0 +1,195 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gconf
+import gobject
+import logging
+import os
+import subprocess
+
+from collections import OrderedDict
+from pango import FontDescription
+
+try:
+    import gio
+except ImportError:
+    gio = None
+
+__all__ = ['SystemMonospaceFont', 'get_scaled_font', 'get_system_monospace_font']
+
+GCONF_MONOSPACE_FONT_DIR = '/desktop/gnome/interface'
+GCONF_MONOSPACE_FONT_PATH = GCONF_MONOSPACE_FONT_DIR + '/monospace_font_name'
+DCONF_MONOSPACE_FONT_PATH = 'org.gnome.desktop.interface'
+DCONF_MONOSPACE_FONT_KEY = 'monospace-font-name'
+DCONF_USER_DB = os.path.join(os.environ.get('XDG_CONFIG_HOME') or
+                             os.path.expanduser('~/.config'), 'dconf', 'user')
+# The dconf database is written for any key, and several times for one
+# change, gsettings is only run once the writes stopped for this long
+DCONF_CHANGE_DELAY = 500  # ms
+
+log = logging.getLogger(__name__)
+
+# The zoom levels of the terminals, each step scales the font by 2 ** (1 / 6)
+MIN_FONT_SCALE = -6
+MAX_FONT_SCALE = 12
+FONT_SCALE_FACTORS = dict((index, 2 ** (index / 6))
+                          for index in range(MIN_FONT_SCALE, MAX_FONT_SCALE + 1))
+
+# font name -> {scale index -> FontDescription}. Only the fonts used
+# lately are kept, the oldest is dropped when another one comes.
+_scaled_fonts = OrderedDict()
+SCALED_FONTS_CACHE_SIZE = 4
+
+
+class SystemMonospaceFont(object):
+
+    """Holds the desktop monospace font. It is read once and kept up to
+    date by watching the setting, so callers never have to spawn
+    gsettings to know it. Watching is done, in order of preference,
+    with a gio.Settings signal, with a file monitor on the dconf
+    database or with a gconf notification. The file monitor needs a
+    gsettings process to read the font, so its changes are debounced.
+    """
+
+    def __init__(self):
+        self.font_name = None
+        self.font = None
+        self.callbacks = []
+        self.settings = None
+        self.monitor = None
+        self.client = None
+        self.change_source_id = None
+        self.watch()
+
+    def watch(self):
+        if gio is not None:
+            try:
+                if DCONF_MONOSPACE_FONT_PATH in gio.settings_list_schemas():
+                    self.settings = gio.Settings(DCONF_MONOSPACE_FONT_PATH)
+                    self.settings.connect('changed::' + DCONF_MONOSPACE_FONT_KEY,
+                                          self.on_changed)
+                    return
+            except AttributeError:
+                # too old pygobject, without GSettings bindings
+                pass
+
+            if os.path.exists(DCONF_USER_DB):
+                self.monitor = gio.File(DCONF_USER_DB).monitor_file()
+                self.monitor.connect('changed', self.on_dconf_changed)
+                return
+
+        self.client = gconf.client_get_default()
+        self.client.add_dir(GCONF_MONOSPACE_FONT_DIR, gconf.CLIENT_PRELOAD_NONE)
+        self.client.notify_add(GCONF_MONOSPACE_FONT_PATH, self.on_changed)
+
+    def read_font_name(self):
+        """Reads the font name from the desktop settings, this is the
+        only place where it is actually fetched.
+        """
+        if self.settings is not None:
+            return self.settings.get_string(DCONF_MONOSPACE_FONT_KEY)
+
+        if self.monitor is not None:
+            try:
+                output = subprocess.check_output(['gsettings', 'get',
+                                                  DCONF_MONOSPACE_FONT_PATH,
+                                                  DCONF_MONOSPACE_FONT_KEY])
+                return output.strip().replace("'", "")
+            except (OSError, subprocess.CalledProcessError):
+                log.exception("Unable to read the monospace font with gsettings")
+
+        return gconf.client_get_default().get_string(GCONF_MONOSPACE_FONT_PATH)
+
+    def get_font(self):
+        """Returns the cached FontDescription of the desktop monospace
+        font, or None if it is not set.
+        """
+        if self.font_name is None:
+            self.update()
+        return self.font
+
+    def update(self):
+        font_name = self.read_font_name() or ''
+        if font_name == self.font_name:
+            return False
+        self.font_name = font_name
+        self.font = FontDescription(font_name) if font_name else None
+        return True
+
+    def connect(self, callback):
+        """Registers `callback' to be called with the new
+        FontDescription when the desktop monospace font changes.
+        """
+        self.callbacks.append(callback)
+
+    def on_dconf_changed(self, *args):
+        if self.change_source_id is not None:
+            gobject.source_remove(self.change_source_id)
+        self.change_source_id = gobject.timeout_add(DCONF_CHANGE_DELAY,
+                                                    self.on_dconf_settled)
+
+    def on_dconf_settled(self):
+        self.change_source_id = None
+        self.on_changed()
+        return False
+
+    def on_changed(self, *args):
+        # the dconf database changes for any key, only notify real changes
+        if not self.update():
+            return
+        log.debug("Desktop monospace font changed to %s", self.font_name)
+        for callback in self.callbacks:
+            callback(self.font)
+
+
+_system_monospace_font = None
+
+
+def get_scaled_font(font_name, scale_index):
+    """Returns the FontDescription of `font_name' zoomed to
+    `scale_index'. It is built once and shared by all terminals, so it
+    must not be modified.
+    """
+    scales = _scaled_fonts.get(font_name)
+    if scales is None:
+        if len(_scaled_fonts) >= SCALED_FONTS_CACHE_SIZE:
+            _scaled_fonts.popitem(last=False)
+        scales = _scaled_fonts[font_name] = {}
+    font = scales.get(scale_index)
+    if font is None:
+        font = scales[scale_index] = FontDescription(font_name)
+        new_size = int(FONT_SCALE_FACTORS[scale_index] * font.get_size())
+        if font.get_size_is_absolute():
+            font.set_absolute_size(new_size)
+        else:
+            font.set_size(new_size)
+    return font
+
+
+def get_system_monospace_font():
+    """Returns the shared SystemMonospaceFont instance.
+    """
+    global _system_monospace_font
+    if _system_monospace_font is None:
+        _system_monospace_font = SystemMonospaceFont()
+    return _system_monospace_font
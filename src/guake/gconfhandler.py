@@ -4,9 +4,11 @@ from __future__ import print_function
 
 
 import gconf
+import gobject
 import gtk
 import logging
-import subprocess
+
+from collections import OrderedDict
 
 from pango import FontDescription
 from xml.sax.saxutils import escape as xml_escape
@@ -14,21 +16,74 @@ from xml.sax.saxutils import escape as xml_escape
 import guake.notifier
 
 from guake.common import _
+from guake.common import get_palette_colors
 from guake.common import pixmapfile
+from guake.fonts import get_system_monospace_font
 from guake.globals import GCONF_PATH
 from guake.globals import GKEY
 from guake.globals import KEY
-from guake.globals import LKEY
+from guake.settings import get_settings
 
 
-GCONF_MONOSPACE_FONT_PATH = '/desktop/gnome/interface/monospace_font_name'
-DCONF_MONOSPACE_FONT_PATH = 'org.gnome.desktop.interface'
-DCONF_MONOSPACE_FONT_KEY = 'monospace-font-name'
+LKEY_DIR = GCONF_PATH + '/keybindings/local'
 
 
 log = logging.getLogger(__name__)
 
 
+class CoalescingDispatcher(object):
+
+    """Collects gconf notifications and runs their handlers once per
+    main loop iteration, only with the latest entry of each key. It is
+    scheduled before the redraw, so a slider dragged in the preferences
+    dialog updates the terminals once per frame instead of once per
+    value.
+    """
+
+    def __init__(self, priority=gobject.PRIORITY_HIGH_IDLE):
+        self.priority = priority
+        self.pending = OrderedDict()
+        self.source_id = None
+
+        # number of notifications dropped because a newer one for the
+        # same key arrived before the pass, and number of handler calls
+        self.coalesced = 0
+        self.dispatched = 0
+
+    def queue(self, client, connection_id, entry, handler):
+        """gconf notification callback, `handler' is given as the
+        user data of notify_add.
+        """
+        pending_key = (handler, entry.get_key())
+        if pending_key in self.pending:
+            self.coalesced += 1
+        self.pending[pending_key] = (client, connection_id, entry)
+        if self.source_id is None:
+            self.source_id = gobject.idle_add(self.on_idle, priority=self.priority)
+
+    def get_stats(self):
+        return {'coalesced': self.coalesced, 'dispatched': self.dispatched}
+
+    def on_idle(self):
+        self.source_id = None
+        self.flush()
+        return False
+
+    def flush(self):
+        """Runs the pending handlers right now.
+        """
+        if self.source_id is not None:
+            gobject.source_remove(self.source_id)
+            self.source_id = None
+        pending, self.pending = self.pending, OrderedDict()
+        for (handler, key), (client, connection_id, entry) in pending.items():
+            self.dispatched += 1
+            try:
+                handler(client, connection_id, entry, None)
+            except Exception:
+                log.exception("Error while applying the new value of %s", key)
+
+
 class GConfHandler(object):
 
     """Handles gconf changes, if any gconf variable is changed, a
@@ -41,10 +96,14 @@ class GConfHandler(object):
         """
         self.guake = guake
 
-        client = gconf.client_get_default()
-        client.add_dir(GCONF_PATH, gconf.CLIENT_PRELOAD_RECURSIVE)
+        self.client = gconf.client_get_default()
+        self.settings = get_settings()
+
+        self.system_font = get_system_monospace_font()
+        self.system_font.connect(self.system_font_changed)
 
-        notify_add = client.notify_add
+        self.dispatcher = CoalescingDispatcher()
+        notify_add = self.notify_add
 
         # these keys does not need to be watched.
         # notify_add(KEY('/general/default_shell'), self.shell_changed)
@@ -98,6 +157,14 @@ class GConfHandler(object):
         notify_add(KEY('/general/custom_command_file'), self.custom_command_file_changed)
         notify_add(KEY('/general/max_tab_name_length'), self.max_tab_name_length_changed)
         notify_add(KEY('/general/abbreviate_tab_names'), self.abbreviate_tab_names_changed)
+        notify_add(KEY('/general/show_running_command'), self.show_running_command_toggled)
+        notify_add(KEY('/general/shell_pool_size'), self.shell_pool_size_changed)
+
+    def notify_add(self, key, handler):
+        """Watches `key', `handler' is called through the dispatcher so
+        a burst of changes is applied once with the latest value.
+        """
+        self.client.notify_add(key, self.dispatcher.queue, handler)
 
     def custom_command_file_changed(self, client, connection_id, entry, data):
         self.guake.load_custom_commands()
@@ -160,13 +227,13 @@ class GConfHandler(object):
         """Called when cursor blink mode settings has been changed
         """
         for term in self.guake.notebook.iter_terminals():
-            term.set_property("cursor-blink-mode", entry.value.get_int())
+            term.update_style({'cursor_blink_mode': entry.value.get_int()})
 
     def cursor_shape_changed(self, client, connection_id, entry, data):
         """Called when the cursor shape settings has been changed
         """
         for term in self.guake.notebook.iter_terminals():
-            term.set_property("cursor-shape", entry.value.get_int())
+            term.update_style({'cursor_shape': entry.value.get_int()})
 
     def scrollbar_toggled(self, client, connection_id, entry, data):
         """If the gconf var use_scrollbar be changed, this method will
@@ -190,7 +257,7 @@ class GConfHandler(object):
         terminals open.
         """
         for i in self.guake.notebook.iter_terminals():
-            i.set_scrollback_lines(entry.value.get_int())
+            i.update_style({'scrollback_lines': entry.value.get_int()})
 
     def keystroke_output(self, client, connection_id, entry, data):
         """If the gconf var scroll_output be changed, this method will
@@ -214,30 +281,38 @@ class GConfHandler(object):
         default or to the chosen font in style/font/style in all
         terminals open.
         """
-        font_name = None
-        if entry.value.get_bool():
-            # cannot directly use the Gio API since it requires to rework completely
-            # the library inclusion, remove dependencies on gobject and so on.
-            # Instead, issuing a direct command line request
-            proc = subprocess.Popen(['gsettings', 'get', DCONF_MONOSPACE_FONT_PATH,
-                                     DCONF_MONOSPACE_FONT_KEY], stdout=subprocess.PIPE)
-            font_name = proc.stdout.readline().replace("'", "")
-            if font_name is None:
-                # Back to gconf
-                font_name = client.get_string(GCONF_MONOSPACE_FONT_PATH)
-            proc.kill()
+        font = self.get_font(entry.value.get_bool())
+        if not font:
+            return
+        for i in self.guake.notebook.iter_terminals():
+            i.update_style({'font': font})
+
+    def get_font(self, use_default_font=None):
+        """Returns the FontDescription the terminals should use: the
+        gnome default monospace font if use_default_font is set, the
+        one in style/font/style otherwise.
+        """
+        if use_default_font is None:
+            use_default_font = self.settings.general.use_default_font
+
+        if use_default_font:
+            font = self.system_font.get_font()
         else:
-            key = KEY('/style/font/style')
-            font_name = client.get_string(key)
+            font_name = self.settings.style.font.style
+            font = FontDescription(font_name) if font_name else None
 
-        if not font_name:
-            log.error("Error: unable to find font name !!!")
-            return
-        font = FontDescription(font_name)
         if not font:
+            log.error("Error: unable to find font name !!!")
+        return font
+
+    def system_font_changed(self, font):
+        """Called by the system font watcher when the desktop monospace
+        font changes, terminals only follow it if use_default_font is set.
+        """
+        if not font or not self.settings.general.use_default_font:
             return
         for i in self.guake.notebook.iter_terminals():
-            i.set_font(font)
+            i.update_style({'font': font})
 
     def allow_bold_toggled(self, client, connection_id, entry, data):
         """If the gconf var allow_bold is changed, this method will be called
@@ -245,7 +320,7 @@ class GConfHandler(object):
         displaying characters in bold font.
         """
         for term in self.guake.notebook.iter_terminals():
-            term.set_allow_bold(entry.value.get_bool())
+            term.update_style({'allow_bold': entry.value.get_bool()})
 
     def palette_font_and_background_color_toggled(self, client, connection_id, entry, data):
         """If the gconf var use_palette_font_and_background_color be changed, this method
@@ -261,7 +336,7 @@ class GConfHandler(object):
         """
         font = FontDescription(entry.value.get_string())
         for i in self.guake.notebook.iter_terminals():
-            i.set_font(font)
+            i.update_style({'font': font})
 
     def fcolor_changed(self, client, connection_id, entry, data):
         """If the gconf var style/font/color be changed, this method
@@ -269,55 +344,31 @@ class GConfHandler(object):
         open.
         """
         fgcolor = gtk.gdk.color_parse(entry.value.get_string())
-        use_palette_font_and_background_color = client.get_bool(
-            KEY('/general/use_palette_font_and_background_color'))
-        if use_palette_font_and_background_color:
+        if self.settings.general.use_palette_font_and_background_color:
             return
         for i in self.guake.notebook.iter_terminals():
-            i.set_color_dim(i.custom_fgcolor or fgcolor)
-            i.set_color_foreground(i.custom_fgcolor or fgcolor)
-            i.set_color_bold(i.custom_fgcolor or fgcolor)
+            i.update_style({'fgcolor': i.custom_fgcolor or fgcolor})
 
     def fpalette_changed(self, client, connection_id, entry, data):
         """If the gconf var style/font/palette be changed, this method
         will be called and will change the color scheme in all terminals
         open.
         """
-        fgcolor = gtk.gdk.color_parse(
-            client.get_string(KEY('/style/font/color')))
-        bgcolor = gtk.gdk.color_parse(
-            client.get_string(KEY('/style/background/color')))
-        palette = [gtk.gdk.color_parse(color) for color in
-                   entry.value.get_string().split(':')]
-
-        use_palette_font_and_background_color = client.get_bool(
-            KEY('/general/use_palette_font_and_background_color'))
-        if use_palette_font_and_background_color and len(palette) > 16:
-            fgcolor = palette[16]
-            bgcolor = palette[17]
+        colors = self.get_colors()
         for i in self.guake.notebook.iter_terminals():
-            i.set_color_dim(fgcolor)
-            i.set_color_foreground(fgcolor)
-            i.set_color_bold(fgcolor)
-            i.set_color_background(bgcolor)
-            i.set_background_tint_color(bgcolor)
-        for i in self.guake.notebook.iter_terminals():
-            i.set_colors(fgcolor, bgcolor, palette[:16])
+            self.apply_terminal_colors(i, colors)
 
     def bgcolor_changed(self, client, connection_id, entry, data):
         """If the gconf var style/background/color be changed, this
         method will be called and will change the background color in
         all terminals open.
         """
-        use_palette_font_and_background_color = client.get_bool(
-            KEY('/general/use_palette_font_and_background_color'))
-        if use_palette_font_and_background_color:
+        if self.settings.general.use_palette_font_and_background_color:
             log.debug("do not set background from user")
             return
         bgcolor = gtk.gdk.color_parse(entry.value.get_string())
         for i in self.guake.notebook.iter_terminals():
-            i.set_color_background(i.custom_bgcolor or bgcolor)
-            i.set_background_tint_color(i.custom_bgcolor or bgcolor)
+            i.update_style({'bgcolor': i.custom_bgcolor or bgcolor})
 
     def bgimage_changed(self, client, connection_id, entry, data):
         """If the gconf var style/background/image be changed, this
@@ -365,10 +416,90 @@ class GConfHandler(object):
         """If the gconf var abbreviate_tab_names be changed, this method will
         be called and will update tab names.
         """
-        abbreviate_tab_names = client.get_bool(KEY('/general/abbreviate_tab_names'))
+        abbreviate_tab_names = self.settings.general.abbreviate_tab_names
         self.guake.abbreviate = abbreviate_tab_names and self.guake.is_tabs_scrollbar_visible()
         self.guake.recompute_tabs_titles()
 
+    def show_running_command_toggled(self, client, connection_id, entry, data):
+        """If the gconf var show_running_command be changed, this method
+        will start or stop showing the foreground commands in tab names.
+        """
+        self.guake.set_show_running_command(bool(self.settings.general.show_running_command))
+
+    def shell_pool_size_changed(self, client, connection_id, entry, data):
+        """If the gconf var shell_pool_size be changed, this method will
+        be called and will resize the pool of shells forked ahead of time.
+        """
+        self.guake.shell_pool.set_size(self.settings.general.shell_pool_size or 0)
+
+    def apply_terminal_settings(self, terminal):
+        """Applies the current configuration to a single terminal. This
+        is what a new tab uses, so opening it does not notify every key
+        and reconfigure all the terminals already open.
+        """
+        settings = self.settings
+
+        # the scrollbar lives next to the terminal in its GuakeTerminalBox
+        scrollbar = terminal.get_parent().get_children()[1]
+        if settings.general.use_scrollbar:
+            scrollbar.show()
+        else:
+            scrollbar.hide()
+        terminal.set_scroll_on_output(settings.general.scroll_output)
+        terminal.set_scroll_on_keystroke(settings.general.scroll_keystroke)
+        self.apply_terminal_colors(terminal, profile=self.get_style_profile())
+        self.guake.apply_background_image(terminal, settings.style.background.image)
+        self.guake.apply_background_transparency(terminal,
+                                                 settings.style.background.transparency)
+
+        terminal.set_backspace_binding(settings.general.compat_backspace)
+        terminal.set_delete_binding(settings.general.compat_delete)
+
+    def get_colors(self):
+        """Returns the font color, the background color and the parsed
+        palette, plus a flag telling if the font and background colors
+        come from the palette.
+        """
+        settings = self.settings
+        fgcolor = gtk.gdk.color_parse(settings.style.font.color)
+        bgcolor = gtk.gdk.color_parse(settings.style.background.color)
+        palette = get_palette_colors(settings.style.font.palette)
+
+        if settings.general.use_palette_font_and_background_color and len(palette) > 16:
+            return palette[16], palette[17], palette, True
+        return fgcolor, bgcolor, palette, False
+
+    def get_style_profile(self):
+        """Returns the whole style of the terminals, as expected by
+        GuakeTerminal.apply_style.
+        """
+        settings = self.settings
+        profile = {
+            'allow_bold': settings.style.font.allow_bold,
+            'cursor_blink_mode': settings.style.cursor_blink_mode,
+            'cursor_shape': settings.style.cursor_shape,
+            'scrollback_lines': settings.general.history_size,
+        }
+        font = self.get_font()
+        if font:
+            profile['font'] = font
+        return profile
+
+    def apply_terminal_colors(self, terminal, colors=None, profile=None):
+        """Sets the palette, font and background colors of a single
+        terminal, honoring its custom colors and the
+        use_palette_font_and_background_color option. `colors' is the
+        result of get_colors(), computed if not given. The colors are
+        applied along with the other style properties of `profile'.
+        """
+        fgcolor, bgcolor, palette, from_palette = colors or self.get_colors()
+        if not from_palette:
+            fgcolor = terminal.custom_fgcolor or fgcolor
+            bgcolor = terminal.custom_bgcolor or bgcolor
+
+        profile = dict(profile or (), palette=palette, fgcolor=fgcolor, bgcolor=bgcolor)
+        terminal.update_style(profile)
+
 
 class GConfKeyHandler(object):
 
@@ -380,7 +511,6 @@ class GConfKeyHandler(object):
         to be used in internal methods.
         """
         self.guake = guake
-        self.accel_group = None  # see reload_accelerators
         self.client = gconf.client_get_default()
 
         notify_add = self.client.notify_add
@@ -392,18 +522,16 @@ class GConfKeyHandler(object):
             notify_add(GKEY(key), self.reload_global)
             self.client.notify(GKEY(key))
 
-        # Setup local keys
-        keys = ['toggle_fullscreen', 'new_tab', 'close_tab', 'rename_current_tab',
-                'previous_tab', 'next_tab', 'clipboard_copy', 'clipboard_paste',
-                'quit', 'zoom_in', 'zoom_out', 'increase_height', 'decrease_height',
-                'increase_transparency', 'decrease_transparency', 'toggle_transparency',
-                "search_on_web", 'move_tab_left', 'move_tab_right',
-                'switch_tab1', 'switch_tab2', 'switch_tab3', 'switch_tab4', 'switch_tab5',
-                'switch_tab6', 'switch_tab7', 'switch_tab8', 'switch_tab9', 'switch_tab10',
-                'switch_tab_last', 'reset_terminal']
-        for key in keys:
-            notify_add(LKEY(key), self.reload_accelerators)
-            self.client.notify(LKEY(key))
+        # Setup local keys. The accel group is built once from a single
+        # read of the keybindings directory, then only the key that
+        # changed is rebound.
+        self.callbacks = self.get_accel_callbacks()
+        self.accelerators = {}
+        self.accel_group = gtk.AccelGroup()
+        self.guake.window.add_accel_group(self.accel_group)
+        self.guake.context_menu.set_accel_group(self.accel_group)
+        self.load_accelerators()
+        notify_add(LKEY_DIR, self.reload_accelerator)
 
     def reload_global(self, client, connection_id, entry, data):
         """Unbind all global hotkeys and rebind the show_hide
@@ -427,143 +555,79 @@ class GConfKeyHandler(object):
                   'Please use Guake Preferences dialog to choose another '
                   'key') % xml_escape(label), filename)
 
-    def reload_accelerators(self, *args):
-        """Reassign an accel_group to guake main window and guake
-        context menu and calls the load_accelerators method.
+    def get_accel_callbacks(self):
+        """Returns the guake method to call for each key under
+        /apps/guake/keybindings/local.
         """
-        if self.accel_group:
-            self.guake.window.remove_accel_group(self.accel_group)
-        self.accel_group = gtk.AccelGroup()
-        self.guake.window.add_accel_group(self.accel_group)
-        self.guake.context_menu.set_accel_group(self.accel_group)
-        self.load_accelerators()
+        callbacks = {
+            'reset_terminal': self.guake.accel_reset_terminal,
+            'quit': self.guake.accel_quit,
+            'new_tab': self.guake.accel_add,
+            'close_tab': self.guake.close_tab,
+            'previous_tab': self.guake.accel_prev,
+            'next_tab': self.guake.accel_next,
+            'move_tab_left': self.guake.accel_move_tab_left,
+            'move_tab_right': self.guake.accel_move_tab_right,
+            'rename_current_tab': self.guake.accel_rename_current_tab,
+            'clipboard_copy': self.guake.accel_copy_clipboard,
+            'clipboard_paste': self.guake.accel_paste_clipboard,
+            'toggle_fullscreen': self.guake.accel_toggle_fullscreen,
+            'toggle_hide_on_lose_focus': self.guake.accel_toggle_hide_on_lose_focus,
+            'zoom_in': self.guake.accel_zoom_in,
+            'zoom_in_alt': self.guake.accel_zoom_in,
+            'zoom_out': self.guake.accel_zoom_out,
+            'increase_height': self.guake.accel_increase_height,
+            'decrease_height': self.guake.accel_decrease_height,
+            'increase_transparency': self.guake.accel_increase_transparency,
+            'decrease_transparency': self.guake.accel_decrease_transparency,
+            'toggle_transparency': self.guake.accel_toggle_transparency,
+            'switch_tab_last': self.guake.accel_switch_tab_last,
+            'search_on_web': self.guake.search_on_web,
+        }
+        for tab in xrange(1, 11):
+            callbacks['switch_tab%d' % tab] = self.guake.gen_accel_switch_tabN(tab - 1)
+        return callbacks
 
     def load_accelerators(self):
         """Reads all gconf paths under /apps/guake/keybindings/local
-        and adds to the main accel_group.
-        """
-        gets = lambda x: self.client.get_string(LKEY(x))
-        key, mask = gtk.accelerator_parse(gets('reset_terminal'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_reset_terminal)
-
-        key, mask = gtk.accelerator_parse(gets('quit'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_quit)
-
-        key, mask = gtk.accelerator_parse(gets('new_tab'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_add)
-
-        key, mask = gtk.accelerator_parse(gets('close_tab'))
-        if key > 0:
-            self.accel_group.connect_group(
-                key, mask, gtk.ACCEL_VISIBLE,
-                self.guake.close_tab)
-
-        key, mask = gtk.accelerator_parse(gets('previous_tab'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_prev)
-
-        key, mask = gtk.accelerator_parse(gets('next_tab'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_next)
-
-        key, mask = gtk.accelerator_parse(gets('move_tab_left'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_move_tab_left)
-
-        key, mask = gtk.accelerator_parse(gets('move_tab_right'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_move_tab_right)
-
-        key, mask = gtk.accelerator_parse(gets('rename_current_tab'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_rename_current_tab)
-
-        key, mask = gtk.accelerator_parse(gets('clipboard_copy'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_copy_clipboard)
-
-        key, mask = gtk.accelerator_parse(gets('clipboard_paste'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_paste_clipboard)
-
-        key, mask = gtk.accelerator_parse(gets('toggle_fullscreen'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_toggle_fullscreen)
-
-        key, mask = gtk.accelerator_parse(gets('toggle_hide_on_lose_focus'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_toggle_hide_on_lose_focus)
-
-        key, mask = gtk.accelerator_parse(gets('zoom_in'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_zoom_in)
-
-        key, mask = gtk.accelerator_parse(gets('zoom_in_alt'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_zoom_in)
-
-        key, mask = gtk.accelerator_parse(gets('zoom_out'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_zoom_out)
-
-        key, mask = gtk.accelerator_parse(gets('increase_height'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_increase_height)
-
-        key, mask = gtk.accelerator_parse(gets('decrease_height'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_decrease_height)
-
-        key, mask = gtk.accelerator_parse(gets('increase_transparency'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_increase_transparency)
-
-        key, mask = gtk.accelerator_parse(gets('decrease_transparency'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_decrease_transparency)
-
-        key, mask = gtk.accelerator_parse(gets('toggle_transparency'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_toggle_transparency)
-
-        for tab in xrange(1, 11):
-            key, mask = gtk.accelerator_parse(gets('switch_tab%d' % tab))
-            if key > 0:
-                self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                               self.guake.gen_accel_switch_tabN(tab - 1))
-
-        key, mask = gtk.accelerator_parse(gets('switch_tab_last'))
-        if key > 0:
-            self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                           self.guake.accel_switch_tab_last)
+        in a single call and adds them to the main accel_group.
+        """
+        for entry in self.client.all_entries(LKEY_DIR):
+            value = entry.get_value()
+            if value is not None:
+                self.bind_accelerator(entry.get_key(), value.get_string())
+
+    def reload_accelerator(self, client, connection_id, entry, data):
+        """Rebinds the key whose gconf path has been changed, the other
+        accelerators are left untouched.
+        """
+        value = entry.get_value()
+        self.bind_accelerator(entry.get_key(), value.get_string() if value else None)
 
-        try:
-            key, mask = gtk.accelerator_parse(gets('search_on_web'))
-            if key > 0:
-                self.accel_group.connect_group(key, mask, gtk.ACCEL_VISIBLE,
-                                               self.guake.search_on_web)
-        except Exception:
-            log.exception("Exception occured")
+    def bind_accelerator(self, key, accel):
+        """Connects the action stored in the gconf path `key' to the
+        accelerator string `accel', replacing the previous binding.
+        """
+        name = key.rsplit('/', 1)[-1]
+        if name not in self.callbacks:
+            return
+        self.unbind_accelerator(name)
+        keyval, mask = gtk.accelerator_parse(accel or '')
+        if keyval > 0:
+            self.accel_group.connect_group(keyval, mask, gtk.ACCEL_VISIBLE,
+                                           self.callbacks[name])
+            self.accelerators[name] = (keyval, mask)
+
+    def unbind_accelerator(self, name):
+        accel = self.accelerators.pop(name, None)
+        if accel is None:
+            return
+        keyval, mask = accel
+        self.accel_group.disconnect_key(keyval, mask)
+
+        # disconnect_key removed every action sharing this accelerator,
+        # put the other ones back.
+        for other, other_accel in self.accelerators.items():
+            if other_accel == accel:
+                self.accel_group.connect_group(keyval, mask, gtk.ACCEL_VISIBLE,
+                                               self.callbacks[other])
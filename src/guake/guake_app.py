@@ -25,38 +25,26 @@ from __future__ import print_function
 import gconf
 import gobject
 import gtk
-import json
 import keybinder
 import logging
 import logging.config
 import os
-import platform
 import pygtk
-import subprocess
 import sys
 import uuid
-import xdg.Exceptions
 
-from urllib import quote_plus
-from urllib import url2pathname
-from urlparse import urlsplit
-from xdg.DesktopEntry import DesktopEntry
 from xml.sax.saxutils import escape as xml_escape
 
 import guake.notifier
 
-try:
-    from colorlog import ColoredFormatter
-except:
-    ColoredFormatter = None
-
-from guake.about import AboutDialog
 from guake.common import _
 from guake.common import gladefile
+from guake.common import lazy_import
 from guake.common import pixmapfile
 from guake.common import shell_quote
 from guake.gconfhandler import GConfHandler
 from guake.gconfhandler import GConfKeyHandler
+from guake.display import DisplayGeometry
 from guake.globals import ALIGN_BOTTOM
 from guake.globals import ALIGN_CENTER
 from guake.globals import ALIGN_LEFT
@@ -67,11 +55,22 @@ from guake.globals import KEY
 from guake.globals import LOCALE_DIR
 from guake.globals import NAME
 from guake.guake_notebook import GuakeNotebook
-from guake.prefs import PrefsDialog
+from guake.guake_notebook import Tab
+from guake.perf import timed
+from guake.procinfo import get_process_scanner
+from guake.settings import get_settings
+from guake.shellpool import ShellPool
 from guake.simplegladeapp import SimpleGladeApp
 from guake.simplegladeapp import bindtextdomain
 from guake.terminal import GuakeTerminalBox
 
+# Only needed for drag and drop, custom commands or proxies, they are
+# imported on first use to keep them out of the startup path
+json = lazy_import('json')
+urllib = lazy_import('urllib')
+urlparse = lazy_import('urlparse')
+xdg_desktop_entry = lazy_import('xdg.DesktopEntry')
+xdg_exceptions = lazy_import('xdg.Exceptions')
 
 libutempter = None
 try:
@@ -93,6 +92,10 @@ instance = None
 RESPONSE_FORWARD = 0
 RESPONSE_BACKWARD = 1
 
+# How often, in milliseconds, the commands running in the tabs are
+# looked for when they are shown in the tab names
+RUNNING_COMMAND_INTERVAL = 1000
+
 # Disable find feature until python-vte hasn't been updated
 enable_find = False
 
@@ -158,8 +161,9 @@ class Guake(SimpleGladeApp):
     def __init__(self):
         super(Guake, self).__init__(gladefile('guake.glade'))
         self.client = gconf.client_get_default()
+        self.settings = get_settings()
 
-        self.debug_mode = self.client.get_bool(KEY('/general/debug_mode'))
+        self.debug_mode = self.settings.general.debug_mode
         self.setupLogging()
 
         # Cannot use "getattr(gtk.Window().get_style(), "base")[int(gtk.STATE_SELECTED)]"
@@ -167,6 +171,8 @@ class Guake(SimpleGladeApp):
         self.selected_color = None
 
         self.prompt_dialog = None
+        self.prefs_dialog = None
+        self.gconf_handler = None
         self.hidden = True
         self.forceHide = False
         self.preventHide = False
@@ -205,6 +211,9 @@ class Guake(SimpleGladeApp):
         self.mainframe = self.get_widget('mainframe')
         self.mainframe.remove(self.get_widget('notebook-teminals'))
         self.notebook = GuakeNotebook()
+        # shells forked ahead of time for the new tabs, disabled unless
+        # general/shell_pool_size is set
+        self.shell_pool = ShellPool(self.spawn_pooled_terminal_box, self.get_shell_key)
         self.notebook.set_name("notebook-teminals")
         self.notebook.set_property("tab_pos", "bottom")
         self.notebook.set_property("show_tabs", False)
@@ -225,6 +234,7 @@ class Guake(SimpleGladeApp):
 
         # check and set ARGB for real transparency
         screen = self.window.get_screen()
+        self.display = DisplayGeometry(screen)
         colormap = screen.get_rgba_colormap()
         if colormap is None:
             self.has_argb = False
@@ -235,9 +245,9 @@ class Guake(SimpleGladeApp):
             def composited_changed(screen):
                 self.has_argb = screen.is_composited()
                 self.set_background_transparency(
-                    self.client.get_int(KEY('/style/background/transparency')))
+                    self.settings.style.background.transparency)
                 self.set_background_image(
-                    self.client.get_string(KEY('/style/background/image')))
+                    self.settings.style.background.image)
 
             self.window.get_screen().connect("composited-changed",
                                              composited_changed)
@@ -288,15 +298,17 @@ class Guake(SimpleGladeApp):
             if event.direction == gtk.gdk.SCROLL_UP:
                 self.notebook.prev_page()
 
-            current_page = self.notebook.get_current_page()
-            tab = self.tabs.get_children()[current_page]
-            rectangle = tab.get_allocation()
+            rectangle = self.notebook.get_current_tab().button.get_allocation()
             adj.set_value(rectangle.x)
 
         evtbox.connect('scroll-event', scroll_manager)
 
         self.abbreviate = False
         self.was_deleted_tab = False
+        # the (abbreviate, max_tab_name_length) values the cached tab
+        # titles were computed with
+        self.tab_titles_key = None
+        self.running_command_source_id = None
 
         def tabs_scrollbar_hide(hscrollbar):
             self.get_widget('event-tabs').set_property('height_request', 10)
@@ -307,7 +319,7 @@ class Guake(SimpleGladeApp):
 
         def tabs_scrollbar_show(hscrollbar):
             self.get_widget('event-tabs').set_property('height_request', -1)
-            if self.client.get_bool(KEY("/general/abbreviate_tab_names")):
+            if self.settings.general.abbreviate_tab_names:
                 self.abbreviate = True
                 self.recompute_tabs_titles()
 
@@ -359,22 +371,24 @@ class Guake(SimpleGladeApp):
         self.add_tab()
 
         # loading and setting up configuration stuff
-        GConfHandler(self)
+        self.gconf_handler = GConfHandler(self)
         self.hotkeys = keybinder
         GConfKeyHandler(self)
         self.load_config()
+        # apply the whole configuration before the window can be shown
+        self.gconf_handler.dispatcher.flush()
 
-        key = self.client.get_string(GKEY('show_hide'))
+        key = self.settings.get(GKEY('show_hide'))
         keyval, mask = gtk.accelerator_parse(key)
         label = gtk.accelerator_get_label(keyval, mask)
         filename = pixmapfile('guake-notification.png')
 
         self.get_widget("context_find_tab").set_visible(enable_find)
 
-        if self.client.get_bool(KEY('/general/start_fullscreen')):
+        if self.settings.general.start_fullscreen:
             self.fullscreen()
 
-        if self.client.get_bool(KEY('/general/use_popup')):
+        if self.settings.general.use_popup:
             # Pop-up that shows that guake is working properly (if not
             # unset in the preferences windows)
             guake.notifier.show_message(
@@ -405,7 +419,7 @@ class Guake(SimpleGladeApp):
     # function to read commands stored at /general/custom_command_file and
     # launch the context menu builder
     def get_custom_commands(self, menu):
-        custom_command_file_path = self.client.get_string(KEY('/general/custom_command_file'))
+        custom_command_file_path = self.settings.general.custom_command_file
         if not custom_command_file_path:
             return False
         file_name = os.path.expanduser(custom_command_file_path)
@@ -462,6 +476,15 @@ class Guake(SimpleGladeApp):
         else:
             base_logging_level = logging.INFO
 
+        # colored logs are only worth loading colorlog at startup when
+        # debugging, guake can start without it too
+        ColoredFormatter = None
+        if self.debug_mode:
+            try:
+                from colorlog import ColoredFormatter
+            except ImportError:
+                pass
+
         if ColoredFormatter:
             logging.config.dictConfig({
                 'version': 1,
@@ -482,7 +505,7 @@ class Guake(SimpleGladeApp):
                 },
                 'formatters': {
                     'default': {
-                        '()': 'colorlog.ColoredFormatter',
+                        '()': ColoredFormatter,
                         'format': "%(log_color)s%(levelname)-8s%(reset)s %(message)s",
                         'log_colors': {
                             'DEBUG': 'cyan',
@@ -508,26 +531,29 @@ class Guake(SimpleGladeApp):
 
     def set_background_transparency(self, transparency):
         for t in self.notebook.iter_terminals():
-            t.set_background_saturation(transparency / 100.0)
-            if self.has_argb:
-                t.set_opacity(int((100 - transparency) / 100.0 * 65535))
+            self.apply_background_transparency(t, transparency)
+
+    def apply_background_transparency(self, terminal, transparency):
+        profile = {'background_saturation': transparency / 100.0}
+        if self.has_argb:
+            profile['opacity'] = int((100 - transparency) / 100.0 * 65535)
+        terminal.update_style(profile)
 
     def set_background_image(self, image):
         for t in self.notebook.iter_terminals():
-            if image and os.path.exists(image):
-                t.set_background_image_file(image)
-                t.set_background_transparent(False)
-            else:
-                """We need to clear the image if it's not set but there is
-                a bug in vte python bindings which doesn't allow None to be
-                passed to set_background_image (C GTK function expects NULL).
-                The user will need to restart Guake after clearing the image.
-                r.set_background_image(None)
-                """
-                if self.has_argb:
-                    t.set_background_transparent(False)
-                else:
-                    t.set_background_transparent(True)
+            self.apply_background_image(t, image)
+
+    def apply_background_image(self, terminal, image):
+        if image and os.path.exists(image):
+            terminal.update_style({'background_image': image, 'background_transparent': False})
+        else:
+            """We need to clear the image if it's not set but there is
+            a bug in vte python bindings which doesn't allow None to be
+            passed to set_background_image (C GTK function expects NULL).
+            The user will need to restart Guake after clearing the image.
+            r.set_background_image(None)
+            """
+            terminal.update_style({'background_transparent': not self.has_argb})
 
     def set_bgcolor(self, bgcolor, tab=None):
         """Set the background color of `tab' or the current tab to `bgcolor'."""
@@ -536,6 +562,8 @@ class Guake(SimpleGladeApp):
         index = tab or self.notebook.get_current_page()
         for terminal in self.notebook.get_terminals_for_tab(index):
             terminal.custom_bgcolor = gtk.gdk.color_parse(bgcolor)
+            if self.gconf_handler is not None:
+                self.gconf_handler.apply_terminal_colors(terminal)
 
     def set_fgcolor(self, fgcolor, tab=None):
         """Set the foreground color of `tab' or the current tab to `fgcolor'."""
@@ -544,6 +572,8 @@ class Guake(SimpleGladeApp):
         index = tab or self.notebook.get_current_page()
         for terminal in self.notebook.get_terminals_for_tab(index):
             terminal.custom_fgcolor = gtk.gdk.color_parse(fgcolor)
+            if self.gconf_handler is not None:
+                self.gconf_handler.apply_terminal_colors(terminal)
 
     def execute_command(self, command, tab=None):
         """Execute the `command' in the `tab'. If tab is None, the
@@ -569,16 +599,11 @@ class Guake(SimpleGladeApp):
         if command[-1] != '\n':
             command += '\n'
         try:
-            tab_uuid = uuid.UUID(tab_uuid)
-            tab_index, = (index for index, t in enumerate(
-                self.notebook.iter_terminals()) if t.get_uuid() == tab_uuid)
-            self.tabs.get_children()[tab_index]
+            tab = self.notebook.get_tab_by_uuid(uuid.UUID(tab_uuid))
         except ValueError:
-            pass
-        else:
-            terminals = self.notebook.get_terminals_for_tab(tab_index)
-            for current_vte in terminals:
-                current_vte.feed_child(command)
+            return
+        if tab is not None:
+            tab.terminal.feed_child(command)
 
     def on_resizer_drag(self, widget, event):
         """Method that handles the resize drag. It does not actuall
@@ -592,7 +617,7 @@ class Guake(SimpleGladeApp):
         screen = self.window.get_screen()
         x, y, _ = screen.get_root_window().get_pointer()
         screen_no = screen.get_monitor_at_point(x, y)
-        valignment = self.client.get_int(KEY('/general/window_valignment'))
+        valignment = self.settings.general.window_valignment
 
         max_height = screen.get_monitor_geometry(screen_no).height
         if valignment == ALIGN_BOTTOM:
@@ -613,8 +638,8 @@ class Guake(SimpleGladeApp):
         else:
             self.window.resize(window_rect[0], y)
             self.printDebug("Just moving on resizer drag to : %r", window_rect[0], y)
-        self.client.set_int(KEY('/general/window_height'), int(percent))
-        self.client.set_float(KEY('/general/window_height_f'), float(percent))
+        self.settings.set_int(KEY('/general/window_height'), int(percent))
+        self.settings.set_float(KEY('/general/window_height_f'), float(percent))
 
     def on_window_losefocus(self, window, event):
         """Hides terminal main window when it loses the focus and if
@@ -629,7 +654,7 @@ class Guake(SimpleGladeApp):
         if self.preventHide:
             return
 
-        value = self.client.get_bool(KEY('/general/window_losefocus'))
+        value = self.settings.general.window_losefocus
         visible = window.get_property('visible')
         if value and visible:
             self.losefocus_time = gtk.gdk.x11_get_server_time(
@@ -704,16 +729,16 @@ class Guake(SimpleGladeApp):
             if event.type == gtk.gdk._2BUTTON_PRESS:
                 self.accel_rename_current_tab()
                 self.set_terminal_focus()
-                self.selected_tab.pressed()
+                self.selected_tab.button.pressed()
                 return
 
-    def show_tab_menu(self, target, event):
+    def show_tab_menu(self, target, event, tab):
         """Shows the tab menu with a right click. After that, the
         focus come back to the terminal.
         """
         if event.button == 3:
             self.showing_context_menu = True
-            self.selected_tab = target
+            self.selected_tab = tab
             menu = self.get_widget('tab-menu')
             menu.popup(None, None, None, 3, event.get_time())
         self.set_terminal_focus()
@@ -723,14 +748,19 @@ class Guake(SimpleGladeApp):
         Dialog.
         """
         self.hide()
+        from guake.about import AboutDialog
         AboutDialog()
 
     def show_prefs(self, *args):
-        """Hides the main window and creates an instance of the
-        Preferences window.
+        """Hides the main window and shows the Preferences window,
+        which is only built the first time.
         """
         self.hide()
-        PrefsDialog().show()
+        if self.prefs_dialog is None:
+            # the preferences module is big, only import it when needed
+            from guake.prefs import PrefsDialog
+            self.prefs_dialog = PrefsDialog()
+        self.prefs_dialog.show()
 
     def is_iconified(self):
         if self.window.window:
@@ -742,6 +772,7 @@ class Guake(SimpleGladeApp):
         state = event.new_window_state
         log.debug("Received window state event: %s", state)
 
+    @timed('show_hide', until_idle=True)
     def show_hide(self, *args):
         """Toggles the main window visibility
         """
@@ -792,7 +823,7 @@ class Guake(SimpleGladeApp):
         #  - self.window.window.get_state doesn't provides us the right information on all
         #    systems, especially on MATE/XFCE
         #
-        # if self.client.get_bool(KEY('/general/focus_if_open')):
+        # if self.settings.general.focus_if_open:
         #     restore_focus = False
         #     if self.window.window:
         #         state = int(self.window.window.get_state())
@@ -815,6 +846,7 @@ class Guake(SimpleGladeApp):
         log.debug("hiding the terminal")
         self.hide()
 
+    @timed('show', until_idle=True)
     def show(self):
         """Shows the main window and grabs the focus on it.
         """
@@ -838,9 +870,8 @@ class Guake(SimpleGladeApp):
             # Reapply the tab color to all button in the tab list, since at least one don't have the
             # select color set. This needs to happen AFTER the first show_all, since before the gtk
             # has not loaded the right colors yet.
-            for tab in self.tabs.get_children():
-                if isinstance(tab, gtk.RadioButton):
-                    tab.modify_bg(gtk.STATE_ACTIVE, gtk.gdk.Color(str(self.selected_color)))
+            for tab in self.notebook.iter_tabs():
+                tab.button.modify_bg(gtk.STATE_ACTIVE, gtk.gdk.Color(str(self.selected_color)))
 
         # move the window even when in fullscreen-mode
         self.printDebug("Moving window to: %r", window_rect)
@@ -848,7 +879,7 @@ class Guake(SimpleGladeApp):
 
         # this work arround an issue in fluxbox
         if not self.is_fullscreen:
-            self.client.notify(KEY('/general/window_height'))
+            self.set_final_window_rect()
 
         try:
             # does it work in other gtk backends
@@ -890,11 +921,6 @@ class Guake(SimpleGladeApp):
         #     self.get_widget('window-root').set_skip_pager_hint(False)
         #     self.get_widget('window-root').set_urgency_hint(False)
 
-        # This is here because vte color configuration works only after the
-        # widget is shown.
-        self.client.notify(KEY('/style/font/color'))
-        self.client.notify(KEY('/style/background/color'))
-
         self.printDebug("Current window position: %r", self.window.get_position())
 
     def hide_from_remote(self):
@@ -931,8 +957,8 @@ class Guake(SimpleGladeApp):
         screen = self.window.get_screen()
 
         # fetch settings
-        use_mouse = self.client.get_bool(KEY('/general/mouse_display'))
-        dest_screen = self.client.get_int(KEY('/general/display_n'))
+        use_mouse = self.settings.general.mouse_display
+        dest_screen = self.settings.general.display_n
 
         if use_mouse:
             x, y, _ = screen.get_root_window().get_pointer()
@@ -940,32 +966,22 @@ class Guake(SimpleGladeApp):
 
         # If Guake is configured to use a screen that is not currently attached,
         # default to 'primary display' option.
-        n_screens = screen.get_n_monitors()
+        n_screens = self.display.get_n_monitors()
         if dest_screen > n_screens - 1:
-            self.client.set_bool(KEY('/general/mouse_display'), False)
-            self.client.set_int(KEY('/general/display_n'), dest_screen)
-            dest_screen = screen.get_primary_monitor()
+            self.settings.set_bool(KEY('/general/mouse_display'), False)
+            self.settings.set_int(KEY('/general/display_n'), dest_screen)
+            dest_screen = self.display.get_primary_monitor()
 
         # Use primary display if configured
         if dest_screen == ALWAYS_ON_PRIMARY:
-            dest_screen = screen.get_primary_monitor()
+            dest_screen = self.display.get_primary_monitor()
 
         return dest_screen
 
     def is_using_unity(self):
-        linux_distrib = platform.linux_distribution()
-        if linux_distrib[0].lower() != "ubuntu":
-            return False
-
-        # http://askubuntu.com/questions/70296/is-there-an-environment-variable-that-is-set-for-unity
-        if float(linux_distrib[1]) - 0.01 < 11.10:
-            if os.environ.get('DESKTOP_SESSION', '').lower() == "gnome".lower():
-                return True
-        else:
-            if os.environ.get('XDG_CURRENT_DESKTOP', '').lower() == "unity".lower():
-                return True
-        return False
+        return self.display.is_using_unity()
 
+    @timed('set_final_window_rect')
     def set_final_window_rect(self):
         """Sets the final size and location of the main window of guake. The height
         is the window_height property, width is window_width and the
@@ -973,15 +989,15 @@ class Guake(SimpleGladeApp):
         """
 
         # fetch settings
-        height_percents = self.client.get_float(KEY('/general/window_height_f'))
+        height_percents = self.settings.general.window_height_f
         if not height_percents:
-            height_percents = self.client.get_int(KEY('/general/window_height'))
+            height_percents = self.settings.general.window_height
 
-        width_percents = self.client.get_float(KEY('/general/window_width_f'))
+        width_percents = self.settings.general.window_width_f
         if not width_percents:
-            width_percents = self.client.get_int(KEY('/general/window_width'))
-        halignment = self.client.get_int(KEY('/general/window_halignment'))
-        valignment = self.client.get_int(KEY('/general/window_valignment'))
+            width_percents = self.settings.general.window_width
+        halignment = self.settings.general.window_halignment
+        valignment = self.settings.general.window_valignment
 
         self.printDebug("set_final_window_rect")
         self.printDebug("  height_percents = %s", height_percents)
@@ -990,55 +1006,22 @@ class Guake(SimpleGladeApp):
         self.printDebug("  valignment = %s", valignment)
 
         # get the rectangle just from the destination monitor
-        screen = self.window.get_screen()
         monitor = self.get_final_window_monitor()
-        window_rect = screen.get_monitor_geometry(monitor)
+        window_rect = self.display.get_monitor_geometry(monitor)
         self.printDebug("Current monitor geometry")
         self.printDebug("  window_rect.x: %s", window_rect.x)
         self.printDebug("  window_rect.y: %s", window_rect.y)
         self.printDebug("  window_rect.height: %s", window_rect.height)
         self.printDebug("  window_rect.width: %s", window_rect.width)
-        self.printDebug("is unity: %s", self.is_using_unity())
-
-        if self.is_using_unity():
-
-            # For Ubuntu 12.10 and above, try to use dconf:
-            # see if unity dock is hiden => unity_hide
-            # and the width of unity dock. => unity_dock
-            found = False
-            unity_hide = 0
-            # float() conversion might mess things up. Add 0.01 so the comparison will always be
-            # valid, even in case of float("10.10") = 10.099999999999999
-            if float(platform.linux_distribution()[1]) + 0.01 >= 12.10:
-                try:
-                    unity_hide = int(subprocess.check_output(
-                        ['/usr/bin/dconf', 'read',
-                         '/org/compiz/profiles/unity/plugins/unityshell/launcher-hide-mode']))
-                    unity_dock = int(subprocess.check_output(
-                        ['/usr/bin/dconf', 'read',
-                         '/org/compiz/profiles/unity/plugins/unityshell/icon-size']) or "48")
-                    found = True
-                except:
-                    # in case of error, just ignore it, 'found' will not be set to True and so
-                    # we execute the fallback
-                    pass
-            if not found:
-                # Fallback: try to bet from gconf
-                unity_hide = self.client.get_int(KEY(
-                    '/apps/compiz-1/plugins/unityshell/screen0/options/launcher_hide_mode'))
-                unity_icon_size = self.client.get_int(KEY(
-                    '/apps/compiz-1/plugins/unityshell/screen0/options/icon_size'))
-                unity_dock = unity_icon_size + 17
-
-            # launcher_hide_mode = 1 => autohide
-            if unity_hide != 1:
-                self.printDebug("correcting window width because of launcher width %s "
-                                "(from %s to %s)",
-                                unity_dock,
-                                window_rect.width,
-                                window_rect.width - unity_dock)
-
-                window_rect.width = window_rect.width - unity_dock
+
+        unity_dock = self.display.get_unity_dock_width()
+        if unity_dock:
+            self.printDebug("correcting window width because of launcher width %s "
+                            "(from %s to %s)",
+                            unity_dock,
+                            window_rect.width,
+                            window_rect.width - unity_dock)
+            window_rect.width = window_rect.width - unity_dock
 
         total_width = window_rect.width
         total_height = window_rect.height
@@ -1112,6 +1095,8 @@ class Guake(SimpleGladeApp):
         self.client.notify(KEY('/general/use_vte_titles'))
         self.client.notify(KEY('/general/abbreviate_tab_names'))
         self.client.notify(KEY('/general/max_tab_name_length'))
+        self.client.notify(KEY('/general/show_running_command'))
+        self.client.notify(KEY('/general/shell_pool_size'))
         self.client.notify(KEY('/general/quick_open_enable'))
         self.client.notify(KEY('/general/quick_open_command_line'))
         self.client.notify(KEY('/style/cursor_shape'))
@@ -1148,8 +1133,8 @@ class Guake(SimpleGladeApp):
         """
         procs = self.notebook.get_running_fg_processes()
         tabs = self.notebook.get_tab_count()
-        prompt_cfg = self.client.get_bool(KEY('/general/prompt_on_quit'))
-        prompt_tab_cfg = self.client.get_int(KEY('/general/prompt_on_close_tab'))
+        prompt_cfg = self.settings.general.prompt_on_quit
+        prompt_tab_cfg = self.settings.general.prompt_on_close_tab
         # "Prompt on tab close" config overrides "prompt on quit" config
         if prompt_cfg or (prompt_tab_cfg == 1 and procs > 0) or (prompt_tab_cfg == 2):
             if self.run_quit_dialog(procs, tabs):
@@ -1179,52 +1164,44 @@ class Guake(SimpleGladeApp):
     def accel_increase_height(self, *args):
         """Callback to increase height.
         """
-        try:
-            height = self.client.get_float(KEY('/general/window_height'))
-        except:
-            height = self.client.get_int(KEY('/general/window_height'))
-
-        self.client.set_int(KEY('/general/window_height'), int(height) + 2)
+        height = self.settings.general.window_height
+        self.settings.set_int(KEY('/general/window_height'), int(height) + 2)
         return True
 
     def accel_decrease_height(self, *args):
         """Callback to decrease height.
         """
-        try:
-            height = self.client.get_float(KEY('/general/window_height'))
-        except:
-            height = self.client.get_int(KEY('/general/window_height'))
-
-        self.client.set_int(KEY('/general/window_height'), int(height) - 2)
+        height = self.settings.general.window_height
+        self.settings.set_int(KEY('/general/window_height'), int(height) - 2)
         return True
 
     def accel_increase_transparency(self, *args):
         """Callback to increase transparency.
         """
-        transparency = self.client.get_int(KEY('/style/background/transparency'))
+        transparency = self.settings.style.background.transparency
         if transparency >= MAX_TRANSPARENCY:
             return True
-        self.client.set_int(KEY('/style/background/transparency'), int(transparency) + 2)
+        self.settings.set_int(KEY('/style/background/transparency'), int(transparency) + 2)
         return True
 
     def accel_decrease_transparency(self, *args):
         """Callback to decrease transparency.
         """
-        transparency = self.client.get_int(KEY('/style/background/transparency'))
+        transparency = self.settings.style.background.transparency
         if transparency <= 0:
             return True
-        self.client.set_int(KEY('/style/background/transparency'), int(transparency) - 2)
+        self.settings.set_int(KEY('/style/background/transparency'), int(transparency) - 2)
         return True
 
     def accel_toggle_transparency(self, *args):
         """Callback to toggle transparency.
         """
         if self.transparency_toggled:
-            self.client.set_int(KEY('/style/background/transparency'), int(self.transparency))
+            self.settings.set_int(KEY('/style/background/transparency'), int(self.transparency))
             self.transparency_toggled = False
             return True
-        self.transparency = self.client.get_int(KEY('/style/background/transparency'))
-        self.client.set_int(KEY('/style/background/transparency'), MAX_TRANSPARENCY)
+        self.transparency = self.settings.style.background.transparency
+        self.settings.set_int(KEY('/style/background/transparency'), MAX_TRANSPARENCY)
         self.transparency_toggled = True
         return True
 
@@ -1285,8 +1262,7 @@ class Guake(SimpleGladeApp):
         """Callback to show the rename tab dialog. Called by the accel
         key.
         """
-        pagepos = self.notebook.get_current_page()
-        self.selected_tab = self.tabs.get_children()[pagepos]
+        self.selected_tab = self.notebook.get_current_tab()
         self.on_rename_current_tab_activate()
         return True
 
@@ -1327,10 +1303,10 @@ class Guake(SimpleGladeApp):
         focus. Called by the accel key.
         """
 
-        if self.client.get_bool(KEY('/general/window_losefocus')):
-            self.client.set_bool(KEY('/general/window_losefocus'), False)
+        if self.settings.general.window_losefocus:
+            self.settings.set_bool(KEY('/general/window_losefocus'), False)
         else:
-            self.client.set_bool(KEY('/general/window_losefocus'), True)
+            self.settings.set_bool(KEY('/general/window_losefocus'), True)
         return True
 
     def fullscreen(self):
@@ -1341,7 +1317,7 @@ class Guake(SimpleGladeApp):
         # fullscreen mode, but tabbar will only be shown if a
         # hidden gconf key is false.
         self.resizer.hide()
-        if not self.client.get_bool(KEY('/general/toolbar_visible_in_fullscreen')):
+        if not self.settings.general.toolbar_visible_in_fullscreen:
             self.toolbar.hide()
 
     def unfullscreen(self):
@@ -1364,6 +1340,15 @@ class Guake(SimpleGladeApp):
 
     # -- callbacks --
 
+    def on_terminal_realize(self, terminal):
+        """vte color configuration works only after the widget is
+        realized, so the colors are applied again, once, when it is.
+        """
+        terminal.disconnect_by_func(self.on_terminal_realize)
+        if self.gconf_handler is not None:
+            terminal.invalidate_style(('palette', 'fgcolor', 'bgcolor'))
+            self.gconf_handler.apply_terminal_colors(terminal)
+
     def on_terminal_exited(self, term, widget):
         """When a terminal is closed, shell process should be killed,
         this is the method that does that, or, at least calls
@@ -1372,57 +1357,126 @@ class Guake(SimpleGladeApp):
         log.debug("Terminal exited: %s", term)
         if libutempter is not None:
             libutempter.utempter_remove_record(term.get_pty())
-        self.delete_tab(self.notebook.page_num(widget), kill=False)
+        tab = self.notebook.get_tab_by_uuid(term.get_uuid())
+        if tab is None:
+            return
+        self.delete_tab(self.notebook.tab_list.index(tab), kill=False)
 
     def recompute_tabs_titles(self):
         """Updates labels on all tabs. This is required when `self.abbreviate`
-        changes
+        changes. The titles are only computed again when the
+        abbreviation or the length limit changed, or for the tabs whose
+        terminal title changed since.
         """
-        use_vte_titles = self.client.get_bool(KEY("/general/use_vte_titles"))
+        use_vte_titles = self.settings.general.use_vte_titles
         if not use_vte_titles:
             return
 
-        for tab, vte in zip(self.tabs.get_children(), self.notebook.term_list):
-            tab.set_label(self.compute_tab_title(vte))
+        key = (self.abbreviate, self.settings.general.max_tab_name_length)
+        if key != self.tab_titles_key:
+            self.tab_titles_key = key
+            for tab in self.notebook.iter_tabs():
+                tab.title = None
+        for tab in self.notebook.iter_tabs():
+            self.update_tab_label(tab)
+
+    def update_tab_label(self, tab):
+        """Sets the label of the `tab' button to its custom label or
+        to its title, computed again only if it was invalidated. The
+        button is left alone if the text did not change.
+        """
+        if tab.custom_label is not None:
+            label = tab.custom_label
+        else:
+            if tab.title is None:
+                tab.title = self.compute_tab_title(tab.terminal)
+                if tab.command:
+                    tab.title = '%s: %s' % (tab.command, tab.title)
+            label = tab.title
+        if tab.button.get_label() != label:
+            tab.button.set_label(label)
+
+    def set_show_running_command(self, show):
+        """Starts or stops looking for the commands running in the
+        tabs to show them in the tab names.
+        """
+        if show and self.running_command_source_id is None:
+            self.running_command_source_id = gobject.timeout_add(RUNNING_COMMAND_INTERVAL,
+                                                                 self.update_running_commands)
+            self.update_running_commands()
+        elif not show and self.running_command_source_id is not None:
+            gobject.source_remove(self.running_command_source_id)
+            self.running_command_source_id = None
+            for tab in self.notebook.iter_tabs():
+                if tab.command is not None:
+                    tab.command = None
+                    tab.title = None
+                    self.update_tab_label(tab)
+
+    def update_running_commands(self):
+        """Updates the names of the tabs whose foreground command
+        changed. Nothing is read while the window is hidden.
+        """
+        if not self.window.get_property('visible'):
+            return True
+        infos = get_process_scanner().get_infos()
+        for tab in self.notebook.iter_tabs():
+            info = infos.get(tab.pid)
+            command = info.fg_command if info is not None else None
+            if command != tab.command:
+                tab.command = command
+                tab.title = None
+                self.update_tab_label(tab)
+        return True
 
     def compute_tab_title(self, vte):
         """Abbreviate and cut vte terminal title when necessary
         """
         vte_title = vte.get_window_title() or _("Terminal")
-        try:
-            current_directory = vte.get_current_directory()
-            if self.abbreviate and vte_title.endswith(current_directory):
-                parts = current_directory.split('/')
-                parts = [s[:1] for s in parts[:-1]] + [parts[-1]]
-                vte_title = vte_title[:len(vte_title) - len(current_directory)] + '/'.join(parts)
-        except OSError:
-            pass
+        # reading the directory of the shell costs a readlink in /proc,
+        # it is only needed to abbreviate the title
+        if self.abbreviate:
+            try:
+                current_directory = vte.get_current_directory()
+                if vte_title.endswith(current_directory):
+                    parts = current_directory.split('/')
+                    parts = [s[:1] for s in parts[:-1]] + [parts[-1]]
+                    vte_title = (vte_title[:len(vte_title) - len(current_directory)] +
+                                 '/'.join(parts))
+            except OSError:
+                pass
         return self._shorten_tab_title(vte_title)
 
     def _shorten_tab_title(self, text):
-        use_vte_titles = self.client.get_bool(KEY("/general/use_vte_titles"))
+        use_vte_titles = self.settings.general.use_vte_titles
         if not use_vte_titles:
             return text
-        max_name_length = self.client.get_int(KEY("/general/max_tab_name_length"))
+        max_name_length = self.settings.general.max_tab_name_length
         if max_name_length != 0 and len(text) > max_name_length:
             text = "..." + text[-max_name_length:]
         return text
 
     def on_terminal_title_changed(self, vte, box):
-        use_vte_titles = self.client.get_bool(KEY("/general/use_vte_titles"))
+        use_vte_titles = self.settings.general.use_vte_titles
         if not use_vte_titles:
             return
-        page = self.notebook.page_num(box)
-        tab = self.tabs.get_children()[page]
+        tab = self.notebook.get_tab_by_uuid(vte.get_uuid())
+        if tab is None:
+            # the shell may set a title before the tab is added
+            return
+        # the shell sets the title at each prompt, that is also when its
+        # directory changes
+        tab.title = None
+        get_process_scanner().invalidate(tab.pid)
         # if tab has been renamed by user, don't override.
-        if not getattr(tab, 'custom_label_set', False):
-            tab.set_label(self.compute_tab_title(vte))
+        if tab.custom_label is None:
+            self.update_tab_label(tab)
 
     def on_rename_current_tab_activate(self, *args):
         """Shows a dialog to rename the current tab.
         """
         entry = gtk.Entry()
-        entry.set_text(self.selected_tab.get_label())
+        entry.set_text(self.selected_tab.button.get_label())
         entry.set_property('can-default', True)
         entry.show()
 
@@ -1453,13 +1507,11 @@ class Guake(SimpleGladeApp):
             new_text = entry.get_text()
             new_text = self._shorten_tab_title(new_text)
 
-            self.selected_tab.set_label(new_text)
+            self.selected_tab.button.set_label(new_text)
             # if user sets empty name, consider he wants default behavior.
-            setattr(self.selected_tab, 'custom_label_set', bool(new_text))
-
-            # holds custom label name of the tab,
-            # we need this to restore the name if the max length is changed
-            setattr(self.selected_tab, 'custom_label_text', new_text)
+            # The custom label name of the tab is kept to restore the name
+            # if the max length is changed
+            self.selected_tab.custom_label = new_text or None
 
             # trigger titling handler in case that custom label has been reset
             current_vte = self.notebook.get_current_terminal()
@@ -1471,8 +1523,7 @@ class Guake(SimpleGladeApp):
     def on_close_activate(self, *args):
         """Tab context menu close handler
         """
-        tabs = self.tabs.get_children()
-        pagepos = tabs.index(self.selected_tab)
+        pagepos = self.notebook.tab_list.index(self.selected_tab)
         self.delete_tab(pagepos)
 
     def on_drag_data_received(self, widget, context,
@@ -1487,17 +1538,17 @@ class Guake(SimpleGladeApp):
         pathlist = []
         app = None
         for uri in droppeduris:
-            scheme, _, path, _, _ = urlsplit(uri)
+            scheme, _, path, _, _ = urlparse.urlsplit(uri)
 
             if scheme != "file":
                 pathlist.append(uri)
             else:
-                filename = url2pathname(path)
+                filename = urllib.url2pathname(path)
 
-                desktopentry = DesktopEntry()
+                desktopentry = xdg_desktop_entry.DesktopEntry()
                 try:
                     desktopentry.parse(filename)
-                except xdg.Exceptions.ParsingError:
+                except xdg_exceptions.ParsingError:
                     pathlist.append(filename)
                     continue
 
@@ -1527,44 +1578,36 @@ class Guake(SimpleGladeApp):
         """Rename an already added tab by its UUID
         """
         try:
-            tab_uuid = uuid.UUID(tab_uuid)
-            tab_index, = (index for index, t in enumerate(
-                self.notebook.iter_terminals()) if t.get_uuid() == tab_uuid)
-            tab = self.tabs.get_children()[tab_index]
+            tab = self.notebook.get_tab_by_uuid(uuid.UUID(tab_uuid))
         except ValueError:
-            pass
-        else:
-            tab.set_label(new_text)
-            setattr(tab, 'custom_label_set', new_text != "-")
-            terminals = self.notebook.get_terminals_for_tab(tab_index)
-            for current_vte in terminals:
-                current_vte.emit('window-title-changed')
+            return
+        if tab is not None:
+            tab.button.set_label(new_text)
+            tab.custom_label = new_text if new_text != "-" else None
+            tab.terminal.emit('window-title-changed')
 
     def rename_tab(self, tab_index, new_text):
         """Rename an already added tab by its index.
         """
         try:
-            tab = self.tabs.get_children()[tab_index]
+            tab = self.notebook.get_tab(tab_index)
         except IndexError:
             pass
         else:
-            tab.set_label(new_text)
-            setattr(tab, 'custom_label_set', new_text != "-")
-            terminals = self.notebook.get_terminals_for_tab(tab_index)
-            for current_vte in terminals:
-                current_vte.emit('window-title-changed')
+            tab.button.set_label(new_text)
+            tab.custom_label = new_text if new_text != "-" else None
+            tab.terminal.emit('window-title-changed')
 
     def rename_current_tab(self, new_text):
         """Sets the `self.selected_tab' var with the selected radio
         button and change its label to `new_text'.
         """
-        pagepos = self.notebook.get_current_page()
-        self.selected_tab = self.tabs.get_children()[pagepos]
-        self.selected_tab.set_label(new_text)
+        self.selected_tab = self.notebook.get_current_tab()
+        self.selected_tab.button.set_label(new_text)
 
         # it's hard to pass an empty string as a command line argument,
         # so we'll interpret single dash "-" as a "reset custom title" request
-        setattr(self.selected_tab, 'custom_label_set', new_text != "-")
+        self.selected_tab.custom_label = new_text if new_text != "-" else None
 
         # trigger titling handler in case that custom label has been reset
         current_vte = self.notebook.get_current_terminal()
@@ -1576,14 +1619,9 @@ class Guake(SimpleGladeApp):
         new one in the same dir.
         """
         active_terminal = self.notebook.get_current_terminal()
-        directory = os.path.expanduser('~')
         if active_terminal:
-            active_pid = active_terminal.get_pid()
-            if active_pid:
-                cwd = os.readlink("/proc/{0}/cwd".format(active_pid))
-                if os.path.exists(cwd):
-                    directory = cwd
-        return directory
+            return active_terminal.get_current_directory()
+        return os.path.expanduser('~')
 
     def get_fork_params(self, default_params=None, box=None):
         """Return all parameters to be passed to the fork_command
@@ -1596,15 +1634,15 @@ class Guake(SimpleGladeApp):
         # shell.
         params = {}
 
-        shell = self.client.get_string(KEY('/general/default_shell'))
+        shell = self.settings.general.default_shell
         if shell and os.path.exists(shell):
             params['command'] = shell
 
-        login_shell = self.client.get_bool(KEY('/general/use_login_shell'))
+        login_shell = self.settings.general.use_login_shell
         if login_shell:
             params['argv'] = ['-']
 
-        if self.client.get_bool(KEY('/general/open_tab_cwd')):
+        if self.settings.general.open_tab_cwd:
             params['directory'] = self.get_current_dir()
         params['loglastlog'] = login_shell
 
@@ -1638,7 +1676,7 @@ class Guake(SimpleGladeApp):
                     proxy + 'authentication_user')
                 auth_pass = self.client.get_string(
                     proxy + 'authentication_password')
-                auth_pass = quote_plus(auth_pass, '')
+                auth_pass = urllib.quote_plus(auth_pass, '')
                 os.environ['http_proxy'] = 'http://%s:%s@%s:%d' % (
                     auth_user, auth_pass, host, port)
                 os.environ['https_proxy'] = 'http://%s:%s@%s:%d' % (
@@ -1652,24 +1690,11 @@ class Guake(SimpleGladeApp):
         else:
             del os.environ['GUAKE_TAB_UUID']
 
-    def add_tab(self, directory=None):
-        """Adds a new tab to the terminal notebook.
+    def spawn_terminal_box(self, directory=None):
+        """Creates a GuakeTerminalBox and forks a shell in it, in
+        `directory' if given.
         """
         box = GuakeTerminalBox()
-        box.terminal.grab_focus()
-        box.terminal.drag_dest_set(gtk.DEST_DEFAULT_MOTION |
-                                   gtk.DEST_DEFAULT_DROP |
-                                   gtk.DEST_DEFAULT_HIGHLIGHT,
-                                   [('text/uri-list', gtk.TARGET_OTHER_APP, 0)],
-                                   gtk.gdk.ACTION_COPY
-                                   )
-        box.terminal.connect('button-press-event', self.show_context_menu)
-        box.terminal.connect('child-exited', self.on_terminal_exited, box)
-        box.terminal.connect('window-title-changed',
-                             self.on_terminal_title_changed, box)
-        box.terminal.connect('drag-data-received',
-                             self.on_drag_data_received,
-                             box)
 
         # -- Ubuntu has a patch to libvte which disables mouse scrolling in apps
         # -- like vim and less by default. If this is the case, enable it back.
@@ -1678,14 +1703,8 @@ class Guake(SimpleGladeApp):
 
         box.show()
 
-        self.notebook.append_tab(box.terminal)
-
-        # We can choose the directory to vte launch. It is important
-        # to be used by dbus interface. I'm testing if directory is a
-        # string because when binded to a signal, the first param can
-        # be a button not a directory.
         default_params = {}
-        if isinstance(directory, basestring):
+        if directory is not None:
             default_params['directory'] = directory
 
         final_params = self.get_fork_params(default_params, box)
@@ -1695,15 +1714,64 @@ class Guake(SimpleGladeApp):
             libutempter.utempter_add_record(
                 box.terminal.get_pty(), os.uname()[1])
         box.terminal.pid = pid
+        return box
+
+    @timed('shell_pool_refill')
+    def spawn_pooled_terminal_box(self):
+        """Forks a shell for the pool, timed apart from add_tab.
+        """
+        return self.spawn_terminal_box()
+
+    def get_shell_key(self):
+        """Returns the settings the pooled shells were forked with.
+        """
+        general = self.settings.general
+        return (general.default_shell, general.use_login_shell, general.open_tab_cwd)
+
+    @timed('add_tab')
+    def add_tab(self, directory=None):
+        """Adds a new tab to the terminal notebook.
+        """
+        # We can choose the directory to vte launch. It is important
+        # to be used by dbus interface. I'm testing if directory is a
+        # string because when binded to a signal, the first param can
+        # be a button not a directory. An empty string means the
+        # default directory too.
+        if not isinstance(directory, basestring) or not directory:
+            directory = None
+
+        # the pooled shells were started in the default directory
+        box = None
+        if directory is None and not self.settings.general.open_tab_cwd:
+            box = self.shell_pool.take()
+        if box is None:
+            box = self.spawn_terminal_box(directory)
+        pid = box.terminal.pid
+
+        box.terminal.grab_focus()
+        box.terminal.drag_dest_set(gtk.DEST_DEFAULT_MOTION |
+                                   gtk.DEST_DEFAULT_DROP |
+                                   gtk.DEST_DEFAULT_HIGHLIGHT,
+                                   [('text/uri-list', gtk.TARGET_OTHER_APP, 0)],
+                                   gtk.gdk.ACTION_COPY
+                                   )
+        box.terminal.connect('button-press-event', self.show_context_menu)
+        box.terminal.connect('realize', self.on_terminal_realize)
+        box.terminal.connect('child-exited', self.on_terminal_exited, box)
+        box.terminal.connect('window-title-changed',
+                             self.on_terminal_title_changed, box)
+        box.terminal.connect('drag-data-received',
+                             self.on_drag_data_received,
+                             box)
+        tab = Tab(box, pid)
 
         # Adding a new radio button to the tabbar
-        label = self.compute_tab_title(box.terminal)
-        tabs = self.tabs.get_children()
-        parent = tabs and tabs[0] or None
-        bnt = gtk.RadioButton(group=parent, label=label, use_underline=False)
+        tab.title = self.compute_tab_title(box.terminal)
+        parent = self.notebook.tab_list[0].button if self.notebook.has_term() else None
+        bnt = gtk.RadioButton(group=parent, label=tab.title, use_underline=False)
         bnt.set_property('can-focus', False)
         bnt.set_property('draw-indicator', False)
-        bnt.connect('button-press-event', self.show_tab_menu)
+        bnt.connect('button-press-event', self.show_tab_menu, tab)
         bnt.connect('button-press-event', self.show_rename_current_tab_dialog)
         bnt.connect('clicked', lambda *x: self.notebook.set_current_page(
             self.notebook.page_num(box)
@@ -1713,21 +1781,23 @@ class Guake(SimpleGladeApp):
                 str(self.selected_color)))
         drag_drop_type = ("text/plain", gtk.TARGET_SAME_APP, 80)
         bnt.drag_dest_set(gtk.DEST_DEFAULT_ALL, [drag_drop_type], gtk.gdk.ACTION_MOVE)
-        bnt.connect("drag_data_received", self.on_drop_tab)
+        bnt.connect("drag_data_received", self.on_drop_tab, tab)
         bnt.drag_source_set(gtk.gdk.BUTTON1_MASK, [drag_drop_type], gtk.gdk.ACTION_MOVE)
-        bnt.connect("drag_data_get", self.on_drag_tab)
+        bnt.connect("drag_data_get", self.on_drag_tab, tab)
         bnt.show()
+        tab.button = bnt
 
         self.tabs.pack_start(bnt, expand=False, padding=1)
 
+        self.notebook.append_tab(tab)
         self.notebook.append_page(box, None)
         self.notebook.set_current_page(self.notebook.page_num(box))
         box.terminal.grab_focus()
-        self.load_config()
 
-        for tab in self.tabs:
-            if getattr(tab, 'custom_label_set', False):
-                tab.set_label(getattr(tab, 'custom_label_text', tab.get_label()))
+        # Only the new terminal needs to be configured, the first one is
+        # handled by the load_config() call done at startup.
+        if self.gconf_handler is not None:
+            self.gconf_handler.apply_terminal_settings(box.terminal)
 
         if self.is_fullscreen:
             self.fullscreen()
@@ -1816,38 +1886,38 @@ class Guake(SimpleGladeApp):
         # elif response_id == RESPONSE_BACKWARD:
         #     buffer.search_backward(search_string, self)
 
-    def on_drag_tab(self, widget, context, selection, targetType, eventTime):
-        tab_pos = self.tabs.get_children().index(widget)
+    def on_drag_tab(self, widget, context, selection, targetType, eventTime, tab):
+        tab_pos = self.notebook.tab_list.index(tab)
         selection.set(selection.target, 32, str(tab_pos))
 
-    def on_drop_tab(self, widget, context, x, y, selection, targetType, data):
+    def on_drop_tab(self, widget, context, x, y, selection, targetType, data, tab):
         old_tab_pos = int(selection.get_text())
-        new_tab_pos = self.tabs.get_children().index(widget)
+        new_tab_pos = self.notebook.tab_list.index(tab)
         self.move_tab(old_tab_pos, new_tab_pos)
 
     def move_tab(self, old_tab_pos, new_tab_pos):
-        self.notebook.reorder_child(
-            self.notebook.get_nth_page(old_tab_pos), new_tab_pos)
-        self.tabs.reorder_child(self.tabs.get_children()[old_tab_pos], new_tab_pos)
+        tab = self.notebook.get_tab(old_tab_pos)
+        self.notebook.reorder_child(tab.box, new_tab_pos)
+        self.tabs.reorder_child(tab.button, new_tab_pos)
         self.notebook.set_current_page(new_tab_pos)
 
     def is_tabs_scrollbar_visible(self):
         return (self.window.get_visible() and
                 self.get_widget('tabs-scrolledwindow').get_hscrollbar().get_visible())
 
+    @timed('delete_tab')
     def delete_tab(self, pagepos, kill=True):
         """This function will destroy the notebook page, terminal and
         tab widgets and will call the function to kill interpreter
         forked by vte.
         """
         # Run prompt if necessary
-        procs = self.notebook.get_running_fg_processes_tab(pagepos)
-        prompt_cfg = self.client.get_int(KEY('/general/prompt_on_close_tab'))
+        prompt_cfg = self.settings.general.prompt_on_close_tab
+        procs = self.notebook.get_running_fg_processes_tab(pagepos) if prompt_cfg else 0
         if (prompt_cfg == 1 and procs > 0) or (prompt_cfg == 2):
             if not self.run_quit_dialog(procs, -1):
                 return
 
-        self.tabs.get_children()[pagepos].destroy()
         self.notebook.delete_tab(pagepos, kill=kill)
 
         if not self.notebook.has_term():
@@ -1858,7 +1928,7 @@ class Guake(SimpleGladeApp):
             self.set_terminal_focus()
 
         self.was_deleted_tab = True
-        abbreviate_tab_names = self.client.get_bool(KEY('/general/abbreviate_tab_names'))
+        abbreviate_tab_names = self.settings.general.abbreviate_tab_names
         if abbreviate_tab_names and not self.is_tabs_scrollbar_visible():
             self.abbreviate = False
             self.recompute_tabs_titles()
@@ -1885,13 +1955,13 @@ class Guake(SimpleGladeApp):
         made with radio buttons must be updated and this method does
         this work.
         """
-        self.tabs.get_children()[page].set_active(True)
+        self.notebook.get_tab(page).button.set_active(True)
 
     def select_tab(self, tab_index):
         """Select an already added tab by its index.
         """
         try:
-            self.tabs.get_children()[tab_index].set_active(True)
+            self.notebook.get_tab(tab_index).button.set_active(True)
             return tab_index
         except IndexError:
             pass
@@ -1901,7 +1971,7 @@ class Guake(SimpleGladeApp):
         self.selected_tab var.
         """
         pagepos = self.notebook.get_current_page()
-        self.selected_tab = self.tabs.get_children()[pagepos]
+        self.selected_tab = self.notebook.get_tab(pagepos)
         return pagepos
 
     def search_on_web(self, *args):
@@ -1913,7 +1983,7 @@ class Guake(SimpleGladeApp):
             current_term.copy_clipboard()
             guake_clipboard = gtk.clipboard_get()
             search_query = guake_clipboard.wait_for_text()
-            search_query = quote_plus(search_query)
+            search_query = urllib.quote_plus(search_query)
             if search_query:
                 search_url = "https://www.google.com/#q=%s&safe=off" % (search_query,)
                 gtk.show_uri(current_term.window.get_screen(), search_url,
@@ -1932,13 +2002,13 @@ class Guake(SimpleGladeApp):
         self.notebook.get_current_terminal().browse_link_under_cursor()
 
     def set_tab_position(self, *args):
-        if self.client.get_bool(KEY('/general/tab_ontop')):
+        if self.settings.general.tab_ontop:
             self.mainframe.reorder_child(self.notebook, 2)
         else:
             self.mainframe.reorder_child(self.notebook, 0)
 
         # make sure resizer is at right position depending on window alignment
-        if self.client.get_int(KEY('/general/window_valignment')) == ALIGN_BOTTOM:
+        if self.settings.general.window_valignment == ALIGN_BOTTOM:
             self.mainframe.reorder_child(self.resizer, 0)
         else:
             self.mainframe.reorder_child(self.resizer, -1)
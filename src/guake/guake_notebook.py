@@ -3,72 +3,107 @@ from __future__ import division
 from __future__ import print_function
 
 import logging
-import posix
 
 from gtk import Notebook
 
+from guake.procinfo import get_process_scanner
+
 
 log = logging.getLogger(__name__)
 
 
+class Tab(object):
+
+    """Everything guake knows about a tab: the terminal, the box holding
+    it in the notebook and the radio button of the tab bar. The label
+    set by the user, if any, is kept in `custom_label', the last title
+    computed for the tab in `title' and the foreground command shown in
+    it in `command'.
+    """
+
+    __slots__ = ('uuid', 'pid', 'terminal', 'box', 'button', 'custom_label', 'title', 'command')
+
+    def __init__(self, box, pid=None):
+        self.uuid = box.terminal.get_uuid()
+        self.pid = pid
+        self.terminal = box.terminal
+        self.box = box
+        self.button = None
+        self.custom_label = None
+        self.title = None
+        self.command = None
+
+
 class GuakeNotebook(Notebook):
 
     def __init__(self, *args, **kwargs):
         Notebook.__init__(self, *args, **kwargs)
 
-        # List of vte.Terminal widgets, it will be useful when needed
-        # to get a widget by the current page in self.notebook
-        self.term_list = []
+        # The Tab records, in the order of the notebook pages
+        self.tab_list = []
 
-        # This is the pid of shells forked by each terminal. Will be
-        # used to kill the process when closing a tab
-        self.pid_list = []
+        # terminal uuid -> Tab, for the operations addressing tabs by
+        # uuid
+        self.uuid_index = {}
 
     def reorder_child(self, child, position):
-        """ We should also reorder elements in term_list
+        """ We should also reorder elements in tab_list
         """
-        old_pos = self.get_children().index(child)
-        self.term_list.insert(position, self.term_list.pop(old_pos))
+        old_pos = self.page_num(child)
+        self.tab_list.insert(position, self.tab_list.pop(old_pos))
         super(GuakeNotebook, self).reorder_child(child, position)
 
     def has_term(self):
-        return self.term_list
+        return self.tab_list
 
     def get_tab_count(self):
-        return len(self.term_list)
+        return len(self.tab_list)
+
+    def get_tab(self, index):
+        return self.tab_list[index]
+
+    def get_current_tab(self):
+        if self.get_current_page() == -1:
+            return None
+        return self.tab_list[self.get_current_page()]
 
     def get_terminals_for_tab(self, index):
-        return [self.term_list[index]]
+        return [self.tab_list[index].terminal]
 
     def get_current_terminal(self):
         if self.get_current_page() == -1:
             return None
-        return self.term_list[self.get_current_page()]
+        return self.tab_list[self.get_current_page()].terminal
 
     def get_running_fg_processes(self):
+        # read again, in one pass, the shells of all tabs
+        scanner = get_process_scanner()
+        scanner.invalidate()
+        infos = scanner.get_infos()
         total_procs = 0
-        for page_index in range(self.get_tab_count()):
-            total_procs += self.get_running_fg_processes_tab(page_index)
+        for tab in self.tab_list:
+            info = infos.get(tab.pid)
+            if info is not None and info.has_fg_process():
+                total_procs += 1
         return total_procs
 
     def get_running_fg_processes_tab(self, index):
-        total_procs = 0
-        for terminal in self.get_terminals_for_tab(index):
-            fdpty = terminal.get_pty()
-            term_pid = terminal.get_pid()
-            try:
-                fgpid = posix.tcgetpgrp(fdpty)
-                if not (fgpid == -1 or fgpid == term_pid):
-                    total_procs += 1
-            except OSError:
-                log.debug("Cannot retrieve any pid from terminal %s, looks like it is already dead",
-                          index)
-                return 0
-        return total_procs
+        scanner = get_process_scanner()
+        pid = self.tab_list[index].pid
+        scanner.invalidate(pid)
+        info = scanner.get_info(pid)
+        if info is None:
+            log.debug("Cannot retrieve any pid from terminal %s, looks like it is already dead",
+                      index)
+            return 0
+        return 1 if info.has_fg_process() else 0
 
     def iter_terminals(self):
-        for t in self.term_list:
-            yield t
+        for tab in self.tab_list:
+            yield tab.terminal
+
+    def iter_tabs(self):
+        return iter(self.tab_list)
 
     def delete_tab(self, pagepos, kill=True):
         for terminal in self.get_terminals_for_tab(pagepos):
@@ -77,8 +112,21 @@ class GuakeNotebook(Notebook):
 
             terminal.destroy()
 
+        tab = self.tab_list.pop(pagepos)
+        del self.uuid_index[tab.uuid]
+        get_process_scanner().unwatch(tab.pid)
+        if tab.button is not None:
+            tab.button.destroy()
         self.remove_page(pagepos)
-        self.term_list.pop(pagepos)
 
-    def append_tab(self, terminal):
-        self.term_list.append(terminal)
+    def append_tab(self, tab):
+        self.tab_list.append(tab)
+        self.uuid_index[tab.uuid] = tab
+        if tab.pid is not None:
+            get_process_scanner().watch(tab.pid)
+
+    def get_tab_by_uuid(self, tab_uuid):
+        """Returns the Tab whose terminal has the `tab_uuid' uuid.UUID,
+        or None.
+        """
+        return self.uuid_index.get(tab_uuid)
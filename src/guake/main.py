@@ -25,28 +25,49 @@ from __future__ import division
 from __future__ import print_function
 
 import dbus
-import gtk
+import gettext
 import logging
 import os
 import subprocess
 import sys
 import uuid
 
+from dbus.mainloop.glib import DBusGMainLoop
 from optparse import OptionParser
 
-from guake.common import ShowableError
-from guake.common import _
-from guake.common import test_gconf
-from guake.dbusiface import DBUS_NAME
-from guake.dbusiface import DBUS_PATH
-from guake.dbusiface import DbusManager
+from guake.globals import DBUS_NAME
+from guake.globals import DBUS_PATH
 from guake.globals import KEY
-from guake.guake_app import Guake
+from guake.globals import LOCALE_DIR
+from guake.globals import NAME
 
+# Most calls only forward the command line to the running instance
+# through D-Bus, so gtk and the application itself are only imported
+# when guake has to be started.
+
+_ = gettext.gettext
 
 log = logging.getLogger(__name__)
 
 
+def start_guake():
+    """Imports the application and creates the Guake instance, along
+    with the D-Bus object that will control it.
+    """
+    from guake.common import ShowableError
+    from guake.common import test_gconf
+    from guake.dbusiface import DbusManager
+    from guake.guake_app import Guake
+
+    if not test_gconf():
+        raise ShowableError(_('Guake can not init!'),
+                            _('Gconf Error.\n'
+                              'Have you installed <b>guake.schemas</b> properly?'))
+
+    instance = Guake()
+    return instance, DbusManager(instance)
+
+
 def main():
     """Parses the command line parameters and decide if dbus methods
     should be called or not. If there is already a guake instance
@@ -62,6 +83,9 @@ def main():
     # Force to xterm-256 colors for compatibility with some old command line programs
     os.environ["TERM"] = "xterm-256color"
 
+    gettext.bindtextdomain(NAME, LOCALE_DIR)
+    gettext.textdomain(NAME)
+
     parser = OptionParser()
     parser.add_option('-f', '--fullscreen', dest='fullscreen',
                       action='store_true', default=False,
@@ -144,13 +168,16 @@ def main():
     # Trying to get an already running instance of guake. If it is not
     # possible, lets create a new instance. This function will return
     # a boolean value depending on this decision.
+    # The session connection is shared with the DbusManager of a new
+    # instance, it must be attached to the glib main loop from the start
+    # to dispatch the calls made to guake. This does not need gtk.
+    DBusGMainLoop(set_as_default=True)
     try:
         bus = dbus.SessionBus()
         remote_object = bus.get_object(DBUS_NAME, DBUS_PATH)
         already_running = True
     except dbus.DBusException:
-        instance = Guake()
-        remote_object = DbusManager(instance)
+        instance, remote_object = start_guake()
         already_running = False
 
     only_show_hide = True
@@ -231,13 +258,10 @@ def main():
 
 
 def exec_main():
-    if not test_gconf():
-        raise ShowableError(_('Guake can not init!'),
-                            _('Gconf Error.\n'
-                              'Have you installed <b>guake.schemas</b> properly?'))
-
     if not main():
+        import gtk
         gtk.main()
 
+
 if __name__ == '__main__':
     exec_main()
@@ -23,12 +23,12 @@ from __future__ import print_function
 import glib
 import logging
 
-import pynotify
-
 from textwrap import dedent
 
 log = logging.getLogger(__name__)
-pynotify.init("Guake")
+
+# pynotify is imported and initialized with the first notification
+pynotify = None
 
 __all__ = ['show_message']
 
@@ -37,7 +37,16 @@ RETRY_INTERVAL = 3  # seconds
 retry_limit = 5  # tries
 
 
+def init_pynotify():
+    global pynotify
+    if pynotify is None:
+        import pynotify as module
+        module.init("Guake")
+        pynotify = module
+
+
 def show_message(brief, body=None, icon=None):
+    init_pynotify()
     try:
         notification = pynotify.Notification(brief, body, icon)
         notification.show()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gobject
+import os
+import time
+
+from collections import deque
+from functools import wraps
+
+__all__ = ['LatencyRecorder', 'get_recorder', 'timed']
+
+# Timing is only done when guake is started with GUAKE_PERF=1, otherwise
+# the decorated methods are left untouched.
+PERF_ENABLED = bool(os.environ.get('GUAKE_PERF'))
+RING_SIZE = 256
+
+
+def percentile(samples, fraction):
+    """Returns the nearest rank percentile of the sorted list
+    `samples'.
+    """
+    if not samples:
+        return 0.0
+    rank = int(round(fraction * (len(samples) - 1)))
+    return samples[rank]
+
+
+class LatencyRecorder(object):
+
+    """Keeps the last RING_SIZE durations of each timed operation.
+    """
+
+    def __init__(self, size=RING_SIZE):
+        self.size = size
+        self.samples = {}
+
+    def record(self, name, seconds):
+        ring = self.samples.get(name)
+        if ring is None:
+            ring = self.samples[name] = deque(maxlen=self.size)
+        ring.append(seconds * 1000)
+
+    def reset(self):
+        self.samples = {}
+
+    def get_stats(self):
+        """Returns, for each operation, the number of samples and the
+        p50, p95 and max latencies in milliseconds.
+        """
+        stats = {}
+        for name, ring in self.samples.items():
+            samples = sorted(ring)
+            stats[name] = {
+                'count': float(len(samples)),
+                'p50': percentile(samples, 0.50),
+                'p95': percentile(samples, 0.95),
+                'max': samples[-1] if samples else 0.0,
+            }
+        return stats
+
+
+_recorder = LatencyRecorder()
+
+
+def get_recorder():
+    return _recorder
+
+
+def timed(name, until_idle=False):
+    """Decorator recording how long the method takes under `name'.
+    With `until_idle', the time until the main loop is idle again is
+    also recorded as `name'_frame, which includes the redraw of the
+    window.
+    """
+    def decorator(func):
+        if not PERF_ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _recorder.record(name, time.time() - start)
+                if until_idle:
+                    gobject.idle_add(on_idle, name + '_frame', start)
+        return wrapper
+    return decorator
+
+
+def on_idle(name, start):
+    _recorder.record(name, time.time() - start)
+    return False
@@ -34,6 +34,7 @@ from pango import FontDescription
 from guake.common import ShowableError
 from guake.common import _
 from guake.common import get_binaries_from_path
+from guake.common import get_palette_colors
 from guake.common import gladefile
 from guake.common import hexify_color
 from guake.common import pixmapfile
@@ -46,10 +47,9 @@ from guake.globals import KEY
 from guake.globals import LKEY
 from guake.globals import LOCALE_DIR
 from guake.globals import NAME
-from guake.palettes import PALETTES
+from guake.palettes import get_palettes
 from guake.simplegladeapp import SimpleGladeApp
 from guake.simplegladeapp import bindtextdomain
-from guake.terminal import GuakeTerminal
 from guake.terminal import QUICK_OPEN_MATCHERS
 
 log = logging.getLogger(__name__)
@@ -161,6 +161,39 @@ HOTKEYS = [
 ]
 
 
+class PaletteSample(gtk.EventBox):
+
+    """A static preview of the terminal colors: a prompt followed by
+    the name of each palette color, written in that color. It replaces
+    a real terminal, which needed a shell to be started each time the
+    preferences were opened.
+    """
+
+    COLOR_NAMES = ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']
+
+    def __init__(self):
+        super(PaletteSample, self).__init__()
+        self.label = gtk.Label()
+        self.label.set_alignment(0, 0)
+        self.label.set_padding(4, 4)
+        self.add(self.label)
+        self.label.show()
+
+    def set_colors(self, fgcolor, bgcolor, palette):
+        self.modify_bg(gtk.STATE_NORMAL, bgcolor)
+        self.label.modify_fg(gtk.STATE_NORMAL, fgcolor)
+
+        lines = ['<b>user@host</b>:~$ ls --color']
+        for bright in (0, 8):
+            lines.append(' '.join(
+                '<span foreground="%s">%s</span>' % (palette[bright + i].to_string(), name)
+                for i, name in enumerate(self.COLOR_NAMES)))
+        self.label.set_markup('\n'.join(lines))
+
+    def set_font(self, font):
+        self.label.modify_font(font)
+
+
 class PrefsCallbacks(object):
 
     """Holds callbacks that will be used in the PrefsDialg class.
@@ -265,6 +298,11 @@ class PrefsCallbacks(object):
         """
         self.client.set_bool(KEY('/general/abbreviate_tab_names'), chk.get_active())
 
+    def on_show_running_command_toggled(self, chk):
+        """Save `show_running_command` property value in gconf
+        """
+        self.client.set_bool(KEY('/general/show_running_command'), chk.get_active())
+
     def on_max_tab_name_length_changed(self, spin):
         """Changes the value of max_tab_name_length in gconf
         """
@@ -450,8 +488,8 @@ class PrefsDialog(SimpleGladeApp):
 
         self.client = gconf.client_get_default()
 
-        # window cleanup handler
-        self.get_widget('config-window').connect('destroy', self.on_destroy)
+        # the dialog is kept around and only hidden when closed
+        self.get_widget('config-window').connect('delete-event', self.on_delete)
 
         # setting evtbox title bg
         eventbox = self.get_widget('eventbox-title')
@@ -493,18 +531,15 @@ class PrefsDialog(SimpleGladeApp):
         column.set_property('expand', False)
         treeview.append_column(column)
 
-        self.demo_terminal = GuakeTerminal()
+        self.demo_palette = PaletteSample()
         demo_terminal_box = self.get_widget('demo_terminal_box')
-        demo_terminal_box.add(self.demo_terminal)
-
-        default_params = {}
-        pid = self.demo_terminal.fork_command(**default_params)
-        self.demo_terminal.pid = pid
+        demo_terminal_box.add(self.demo_palette)
 
         self.populate_shell_combo()
         self.populate_keys_tree()
-        self.populate_display_n()
-        self.load_configs()
+        self.populate_quick_open_patterns()
+        self.populate_custom_command_filters()
+        self.fill_palette_names()
         self.get_widget('config-window').hide()
 
         # Preview when selecting a bgimage
@@ -521,9 +556,12 @@ class PrefsDialog(SimpleGladeApp):
                                    self.selection_preview)
 
     def show(self):
-        """Calls the main window show_all method and presents the
-        window in the desktop.
+        """Reloads the configuration, since it may have changed since
+        the dialog was last shown, calls the main window show_all
+        method and presents the window in the desktop.
         """
+        self.populate_display_n()
+        self.load_configs()
         self.get_widget('config-window').show_all()
         self.get_widget('config-window').present()
 
@@ -532,9 +570,9 @@ class PrefsDialog(SimpleGladeApp):
         """
         self.get_widget('config-window').hide()
 
-    def on_destroy(self, window):
-        self.demo_terminal.kill()
-        self.demo_terminal.destroy()
+    def on_delete(self, window, event):
+        self.hide()
+        return True
 
     def update_preview(self, file_chooser, preview):
         """Used by filechooser to preview image files
@@ -618,13 +656,14 @@ class PrefsDialog(SimpleGladeApp):
         """Changes the value of palette in gconf
         """
         palette_name = combo.get_active_text()
-        if palette_name not in PALETTES:
+        palettes = get_palettes()
+        if palette_name not in palettes:
             return
         self.client.set_string(KEY('/style/font/palette'),
-                               PALETTES[palette_name])
+                               palettes[palette_name])
         self.client.set_string(KEY('/style/font/palette_name'), palette_name)
-        self.set_palette_colors(PALETTES[palette_name])
-        self.update_demo_palette(PALETTES[palette_name])
+        self.set_palette_colors(palettes[palette_name])
+        self.update_demo_palette(palettes[palette_name])
 
     def on_cursor_shape_changed(self, combo):
         """Changes the value of cursor_shape in gconf
@@ -670,7 +709,7 @@ class PrefsDialog(SimpleGladeApp):
             self.client.get_string(KEY('/style/font/color')))
         bgcolor = gtk.gdk.color_parse(
             self.client.get_string(KEY('/style/background/color')))
-        palette = [gtk.gdk.color_parse(color) for color in palette.split(':')]
+        palette = get_palette_colors(palette)
         font_name = self.client.get_string(KEY('/style/font/style'))
         font = FontDescription(font_name)
 
@@ -679,19 +718,15 @@ class PrefsDialog(SimpleGladeApp):
         if use_palette_font_and_background_color and len(palette) > 16:
             fgcolor = palette[16]
             bgcolor = palette[17]
-        self.demo_terminal.set_color_dim(fgcolor)
-        self.demo_terminal.set_color_foreground(fgcolor)
-        self.demo_terminal.set_color_bold(fgcolor)
-        self.demo_terminal.set_color_background(bgcolor)
-        self.demo_terminal.set_background_tint_color(bgcolor)
-        self.demo_terminal.set_colors(fgcolor, bgcolor, palette[:16])
-        self.demo_terminal.set_font(font)
+        self.demo_palette.set_colors(fgcolor, bgcolor, palette[:16])
+        self.demo_palette.set_font(font)
 
     def fill_palette_names(self):
         combo = self.get_widget('palette_name')
-        for palette_name in sorted(PALETTES.keys()):
+        palettes = get_palettes()
+        for palette_name in sorted(palettes.keys()):
             combo.append_text(palette_name)
-        self.custom_palette_index = len(PALETTES)
+        self.custom_palette_index = len(palettes)
         combo.append_text(_('Custom'))
 
     def set_cursor_shape(self, shape_index):
@@ -703,9 +738,7 @@ class PrefsDialog(SimpleGladeApp):
     def set_palette_colors(self, palette):
         """Updates the color buttons with the given palette
         """
-        palette = palette.split(':')
-        for i, pal in enumerate(palette):
-            color = gtk.gdk.color_parse(pal)
+        for i, color in enumerate(get_palette_colors(palette)):
             self.get_widget('palette_%d' % i).set_color(color)
 
     def reload_erase_combos(self, btn=None):
@@ -785,6 +818,10 @@ class PrefsDialog(SimpleGladeApp):
         value = self.client.get_int(KEY('/general/max_tab_name_length'))
         self.get_widget('max_tab_name_length').set_value(value)
 
+        # show running command
+        value = self.client.get_bool(KEY('/general/show_running_command'))
+        self.get_widget('show_running_command').set_active(value)
+
         self.update_vte_subwidgets_states()
 
         value = self.client.get_float(KEY('/general/window_height_f'))
@@ -832,11 +869,6 @@ class PrefsDialog(SimpleGladeApp):
         self.get_widget('quick_open_enable').set_active(value)
         self.get_widget('quick_open_command_line').set_sensitive(value)
         self.get_widget('quick_open_in_current_terminal').set_sensitive(value)
-        text = gtk.TextBuffer()
-        text = self.get_widget('quick_open_supported_patterns').get_buffer()
-        for title, matcher, _useless in QUICK_OPEN_MATCHERS:
-            text.insert_at_cursor("%s: %s\n" % (title, matcher))
-        self.get_widget('quick_open_supported_patterns').set_buffer(text)
 
         value = self.client.get_string(KEY('/general/quick_open_command_line'))
         if value is None:
@@ -928,7 +960,6 @@ class PrefsDialog(SimpleGladeApp):
         self.get_widget('allow_bold').set_active(value)
 
         # palette
-        self.fill_palette_names()
         value = self.client.get_string(KEY('/style/font/palette_name'))
         self.set_palette_name(value)
         value = self.client.get_string(KEY('/style/font/palette'))
@@ -963,14 +994,6 @@ class PrefsDialog(SimpleGladeApp):
             custom_command_file_name = os.path.expanduser(custom_command_file)
         else:
             custom_command_file_name = None
-        custom_cmd_filter = gtk.FileFilter()
-        custom_cmd_filter.set_name(_("JSON files"))
-        custom_cmd_filter.add_pattern("*.json")
-        self.get_widget('custom_command_file_chooser').add_filter(custom_cmd_filter)
-        all_files_filter = gtk.FileFilter()
-        all_files_filter.set_name(_("All files"))
-        all_files_filter.add_pattern("*")
-        self.get_widget('custom_command_file_chooser').add_filter(all_files_filter)
         if custom_command_file_name:
             self.get_widget('custom_command_file_chooser').set_filename(custom_command_file_name)
 
@@ -1016,11 +1039,33 @@ class PrefsDialog(SimpleGladeApp):
                           3, True)
         self.get_widget('treeview-keys').expand_all()
 
+    def populate_quick_open_patterns(self):
+        """Lists the patterns understood by quick open.
+        """
+        text = self.get_widget('quick_open_supported_patterns').get_buffer()
+        for title, matcher, _useless in QUICK_OPEN_MATCHERS:
+            text.insert_at_cursor("%s: %s\n" % (title, matcher))
+
+    def populate_custom_command_filters(self):
+        """Adds the file filters of the custom commands file chooser.
+        """
+        custom_cmd_filter = gtk.FileFilter()
+        custom_cmd_filter.set_name(_("JSON files"))
+        custom_cmd_filter.add_pattern("*.json")
+        self.get_widget('custom_command_file_chooser').add_filter(custom_cmd_filter)
+        all_files_filter = gtk.FileFilter()
+        all_files_filter.set_name(_("All files"))
+        all_files_filter.add_pattern("*")
+        self.get_widget('custom_command_file_chooser').add_filter(all_files_filter)
+
     def populate_display_n(self):
         """Get the number of displays and populate this drop-down box
-        with them all. Prepend the "always on primary" option.
+        with them all. Prepend the "always on primary" option. Monitors
+        may have been plugged since the last call, so the list is
+        rebuilt each time.
         """
         cb = self.get_widget('display_n')
+        cb.get_model().clear()
         screen = self.get_widget('config-window').get_screen()
 
         cb.append_text("always on primary")
@@ -1161,14 +1206,9 @@ def setup_standalone_signals(instance):
     makes the delete event of dialog and click on close button finish
     the application.
     """
+    # Both the close button and the delete event just hide the dialog
     window = instance.get_widget('config-window')
-    window.connect('delete-event', gtk.main_quit)
-
-    # We need to block the execution of the already associated
-    # callback before connecting the new handler.
-    button = instance.get_widget('button1')
-    button.handler_block_by_func(instance.gtk_widget_destroy)
-    button.connect('clicked', gtk.main_quit)
+    window.connect('hide', gtk.main_quit)
 
     return instance
 
@@ -0,0 +1,181 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import logging
+import os
+import time
+
+__all__ = ['ProcessInfo', 'ProcessScanner', 'get_process_scanner']
+
+# How long, in seconds, what was read in /proc is trusted
+PROCESS_INFO_TTL = 1.0
+
+log = logging.getLogger(__name__)
+
+
+class ProcessInfo(object):
+
+    """What /proc says about the shell of a tab: its process group, the
+    foreground process group of its terminal (-1 when it has none), its
+    working directory, the name of the foreground command when it is
+    not the shell itself and its number of children.
+    """
+
+    __slots__ = ('pid', 'pgid', 'fg_pgid', 'cwd', 'fg_command', 'children')
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.pgid = None
+        self.fg_pgid = -1
+        self.cwd = None
+        self.fg_command = None
+        self.children = 0
+
+    def has_fg_process(self):
+        return not (self.fg_pgid == -1 or self.fg_pgid == self.pid)
+
+
+def read_file(path):
+    with open(path) as f:
+        return f.read()
+
+
+def read_stat(pid):
+    """Returns the fields of /proc/`pid'/stat following the command
+    name, which may contain spaces and parenthesis.
+    """
+    stat = read_file('/proc/%d/stat' % pid)
+    return stat[stat.rindex(')') + 2:].split()
+
+
+def count_children(pids):
+    """Counts the children of each process in `pids' by reading the
+    parent of every process, for the kernels without the
+    /proc/PID/task/PID/children files.
+    """
+    children = dict((pid, 0) for pid in pids)
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            ppid = int(read_stat(int(name))[1])
+        except (IOError, OSError, ValueError):
+            continue
+        if ppid in children:
+            children[ppid] += 1
+    return children
+
+
+class ProcessScanner(object):
+
+    """Reads what guake needs to know about the shells of all the tabs
+    in one pass over /proc, and keeps it for PROCESS_INFO_TTL seconds,
+    so the quit dialog, the tab titles and the running command shown in
+    the tabs do not each read /proc for each tab.
+    """
+
+    def __init__(self, ttl=PROCESS_INFO_TTL):
+        self.ttl = ttl
+        self.pids = set()
+        self.infos = {}
+        self.scanned_at = None
+        # the pids to read again before the TTL expires
+        self.stale = set()
+
+    def watch(self, pid):
+        self.pids.add(pid)
+        self.stale.add(pid)
+
+    def unwatch(self, pid):
+        self.pids.discard(pid)
+        self.stale.discard(pid)
+        self.infos.pop(pid, None)
+
+    def invalidate(self, pid=None):
+        """Forgets what was read about the shell `pid', or about all of
+        them.
+        """
+        if pid is None:
+            self.scanned_at = None
+        elif pid in self.pids:
+            self.stale.add(pid)
+
+    def get_infos(self):
+        """Returns a dict mapping the pid of each watched shell still
+        alive to its ProcessInfo.
+        """
+        now = time.time()
+        if self.scanned_at is None or now - self.scanned_at > self.ttl:
+            self.infos = self.scan(self.pids)
+            self.scanned_at = now
+            self.stale.clear()
+        elif self.stale:
+            for pid in self.stale:
+                self.infos.pop(pid, None)
+            self.infos.update(self.scan(self.stale))
+            self.stale.clear()
+        return self.infos
+
+    def get_info(self, pid):
+        """Returns the ProcessInfo of the watched shell `pid', or None
+        if it is gone.
+        """
+        return self.get_infos().get(pid)
+
+    def scan(self, pids):
+        infos = {}
+        missing_children = []
+        for pid in pids:
+            info = ProcessInfo(pid)
+            try:
+                fields = read_stat(pid)
+                info.pgid = int(fields[2])
+                info.fg_pgid = int(fields[5])
+                info.cwd = os.readlink('/proc/%d/cwd' % pid)
+            except (IOError, OSError):
+                log.debug("Process %d is gone", pid)
+                continue
+            if info.has_fg_process():
+                try:
+                    info.fg_command = read_file('/proc/%d/comm' % info.fg_pgid).strip()
+                except IOError:
+                    pass
+            try:
+                info.children = len(read_file('/proc/%d/task/%d/children' % (pid, pid)).split())
+            except IOError:
+                missing_children.append(pid)
+            infos[pid] = info
+        if missing_children:
+            for pid, children in count_children(missing_children).items():
+                infos[pid].children = children
+        return infos
+
+
+_scanner = None
+
+
+def get_process_scanner():
+    global _scanner
+    if _scanner is None:
+        _scanner = ProcessScanner()
+    return _scanner
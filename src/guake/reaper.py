@@ -0,0 +1,131 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gobject
+import logging
+import os
+import signal
+import time
+
+from collections import deque
+
+from guake.procinfo import read_stat
+
+__all__ = ['ShellReaper', 'get_shell_reaper']
+
+# Seconds a shell has to exit after SIGHUP before it gets a SIGKILL
+KILL_TIMEOUT = 3.0
+
+log = logging.getLogger(__name__)
+
+
+class ShellReaper(object):
+
+    """Kills the shells of the closed tabs without blocking nor starting
+    a thread for each of them. The shells get a SIGHUP and are reaped by
+    a glib child watch, which relies on a single SIGCHLD handler. The
+    ones still alive after KILL_TIMEOUT seconds get a SIGKILL.
+
+    glib < 2.36 may report the exit of a pid watched twice, by vte and by
+    the reaper, to the other watch only. So the start time of each shell
+    is kept, and a shell whose pid is gone or was given to a new process
+    by its deadline is forgotten instead of killed.
+
+    All shells wait for the same timeout, so the deadlines are queued in
+    order and a single timer, set for the earliest one, is needed.
+    """
+
+    def __init__(self, timeout=KILL_TIMEOUT):
+        self.timeout = timeout
+        # pid -> child watch source id
+        self.pending = {}
+        # (deadline, pid, start time), oldest first
+        self.deadlines = deque()
+        self.timer_id = None
+
+    def reap(self, pid):
+        try:
+            os.kill(pid, signal.SIGHUP)
+        except OSError:
+            # already gone, and already reaped
+            return
+        if pid in self.pending:
+            return
+        self.pending[pid] = gobject.child_watch_add(pid, self.on_child_exited)
+        self.deadlines.append((time.time() + self.timeout, pid, get_start_time(pid)))
+        if self.timer_id is None:
+            self.schedule()
+
+    def get_pending_count(self):
+        """Returns the number of shells still shutting down.
+        """
+        return len(self.pending)
+
+    def on_child_exited(self, pid, status):
+        log.debug("Shell %d exited with status %d", pid, status)
+        self.pending.pop(pid, None)
+
+    def schedule(self):
+        delay = max(0, self.deadlines[0][0] - time.time())
+        self.timer_id = gobject.timeout_add(int(delay * 1000) + 1, self.on_timeout)
+
+    def on_timeout(self):
+        now = time.time()
+        while self.deadlines and self.deadlines[0][0] <= now:
+            deadline, pid, start_time = self.deadlines.popleft()
+            if pid not in self.pending:
+                continue
+            if start_time is None or get_start_time(pid) != start_time:
+                log.debug("Shell %d was reaped by an other child watch", pid)
+                gobject.source_remove(self.pending.pop(pid))
+                continue
+            log.debug("Shell %d did not exit after SIGHUP, killing it", pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                # it exited meanwhile, the child watch is about to run
+                pass
+        self.timer_id = None
+        if self.deadlines:
+            self.schedule()
+        return False
+
+
+def get_start_time(pid):
+    """Returns the start time of the process `pid', which tells it apart
+    from a later process given the same pid, or None if it is gone.
+    """
+    try:
+        return int(read_stat(pid)[19])
+    except (IOError, OSError, IndexError, ValueError):
+        return None
+
+
+_reaper = None
+
+
+def get_shell_reaper():
+    global _reaper
+    if _reaper is None:
+        _reaper = ShellReaper()
+    return _reaper
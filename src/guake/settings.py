@@ -0,0 +1,140 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gconf
+import logging
+
+from guake.globals import GCONF_PATH
+
+__all__ = ['Settings', 'SettingsSection', 'get_settings']
+
+log = logging.getLogger(__name__)
+
+
+def python_value(value):
+    """Converts a gconf.Value to the matching python type.
+    """
+    if value is None:
+        return None
+    if value.type == gconf.VALUE_BOOL:
+        return value.get_bool()
+    if value.type == gconf.VALUE_INT:
+        return value.get_int()
+    if value.type == gconf.VALUE_FLOAT:
+        return value.get_float()
+    if value.type == gconf.VALUE_STRING:
+        return value.get_string()
+    if value.type == gconf.VALUE_LIST:
+        return [python_value(v) for v in value.get_list()]
+    log.debug("Unsupported gconf value type %s", value.type)
+    return None
+
+
+class SettingsSection(object):
+
+    """A directory of the gconf tree. Its keys and subdirectories are
+    plain attributes, a key that is not set reads as None.
+    """
+
+    def __getattr__(self, name):
+        return None
+
+
+class Settings(object):
+
+    """In memory copy of the whole /apps/guake gconf tree. It is loaded
+    once and kept current by a single notification on the directory,
+    so hot paths read `settings.general.use_vte_titles' instead of
+    asking the gconf client each time.
+
+    Values written with the set_* methods are visible immediately,
+    without waiting for the gconf notification to come back.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or gconf.client_get_default()
+        self.root = SettingsSection()
+        self.values = {}
+        self.client.add_dir(GCONF_PATH, gconf.CLIENT_PRELOAD_RECURSIVE)
+        self.load(GCONF_PATH)
+        self.client.notify_add(GCONF_PATH, self.on_changed)
+
+    def __getattr__(self, name):
+        if name == 'root':
+            raise AttributeError(name)
+        return getattr(self.root, name)
+
+    def load(self, directory):
+        for entry in self.client.all_entries(directory):
+            self.update(entry.get_key(), python_value(entry.get_value()))
+        for subdir in self.client.all_dirs(directory):
+            self.load(subdir)
+
+    def update(self, key, value):
+        self.values[key] = value
+        section = self.root
+        names = key[len(GCONF_PATH) + 1:].split('/')
+        for name in names[:-1]:
+            subsection = section.__dict__.get(name)
+            if subsection is None:
+                subsection = SettingsSection()
+                setattr(section, name, subsection)
+            section = subsection
+        setattr(section, names[-1], value)
+
+    def on_changed(self, client, connection_id, entry, data):
+        self.update(entry.get_key(), python_value(entry.get_value()))
+
+    def get(self, key, default=None):
+        """Returns the value of the full gconf path `key'.
+        """
+        value = self.values.get(key)
+        return default if value is None else value
+
+    def set_bool(self, key, value):
+        self.update(key, value)
+        self.client.set_bool(key, value)
+
+    def set_int(self, key, value):
+        self.update(key, value)
+        self.client.set_int(key, value)
+
+    def set_float(self, key, value):
+        self.update(key, value)
+        self.client.set_float(key, value)
+
+    def set_string(self, key, value):
+        self.update(key, value)
+        self.client.set_string(key, value)
+
+
+_settings = None
+
+
+def get_settings():
+    """Returns the shared Settings instance, loading it on first use.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
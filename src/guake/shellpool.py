@@ -0,0 +1,120 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import gobject
+import logging
+
+__all__ = ['ShellPool']
+
+log = logging.getLogger(__name__)
+
+
+class ShellPool(object):
+
+    """Keeps `size' terminals whose shell was forked ahead of time, so
+    a new tab gets a shell that already ran its rc files. The pool is
+    filled again, one shell at a time, when the main loop is idle.
+
+    `spawn' is called without arguments and returns a GuakeTerminalBox
+    whose shell was forked. `get_key' returns what the shells depend
+    on, like the shell command, the pooled shells are dropped when it
+    changes.
+    """
+
+    def __init__(self, spawn, get_key):
+        self.spawn = spawn
+        self.get_key = get_key
+        self.size = 0
+        self.boxes = []
+        self.key = None
+        self.hits = 0
+        self.misses = 0
+        self.refill_id = None
+
+    def set_size(self, size):
+        self.size = max(0, size)
+        while len(self.boxes) > self.size:
+            self.discard(self.boxes.pop())
+        self.schedule_refill()
+
+    def take(self):
+        """Returns a GuakeTerminalBox from the pool, or None if it is
+        empty or disabled.
+        """
+        if not self.size:
+            return None
+        if self.boxes and self.key != self.get_key():
+            self.clear()
+        if not self.boxes:
+            self.misses += 1
+            self.schedule_refill()
+            return None
+        self.hits += 1
+        box = self.boxes.pop(0)
+        box.terminal.disconnect_by_func(self.on_child_exited)
+        self.schedule_refill()
+        return box
+
+    def clear(self):
+        while self.boxes:
+            self.discard(self.boxes.pop())
+
+    def discard(self, box):
+        box.terminal.disconnect_by_func(self.on_child_exited)
+        box.terminal.kill()
+        box.destroy()
+
+    def get_stats(self):
+        return {
+            'size': self.size,
+            'ready': len(self.boxes),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def schedule_refill(self):
+        if self.refill_id is None and len(self.boxes) < self.size:
+            self.refill_id = gobject.idle_add(self.refill, priority=gobject.PRIORITY_LOW)
+
+    def refill(self):
+        if len(self.boxes) >= self.size:
+            self.refill_id = None
+            return False
+        key = self.get_key()
+        if self.boxes and key != self.key:
+            self.clear()
+        self.key = key
+        box = self.spawn()
+        box.terminal.connect('child-exited', self.on_child_exited, box)
+        self.boxes.append(box)
+        if len(self.boxes) >= self.size:
+            self.refill_id = None
+            return False
+        return True
+
+    def on_child_exited(self, terminal, box):
+        # not refilled here, a shell failing to start would be forked
+        # again and again
+        log.debug("A pooled shell exited")
+        self.boxes.remove(box)
+        box.destroy()
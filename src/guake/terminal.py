@@ -22,26 +22,41 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import gconf
 import gtk
 import logging
 import os
 import pango
 import re
-import signal
 import subprocess
 import uuid
 import vte
 
 
 from guake.common import clamp
-from guake.globals import KEY
-from thread import start_new_thread
-from time import sleep
+from guake.fonts import MAX_FONT_SCALE
+from guake.fonts import MIN_FONT_SCALE
+from guake.fonts import get_scaled_font
+from guake.procinfo import get_process_scanner
+from guake.reaper import get_shell_reaper
+from guake.settings import get_settings
 
 log = logging.getLogger(__name__)
 
-__all__ = ["GuakeTerminalBox"]
+__all__ = ["GuakeTerminalBox", "get_style_stats"]
+
+# The style properties GuakeTerminal.apply_style knows, in the order
+# they are applied: a new font resets the zoom and set_colors() resets
+# the foreground and background colors, so the font and the palette
+# must come first.
+STYLE_PROPERTIES = ('font', 'font_scale', 'palette', 'fgcolor', 'bgcolor', 'allow_bold',
+                    'cursor_blink_mode', 'cursor_shape', 'scrollback_lines',
+                    'background_image', 'background_transparent', 'background_saturation',
+                    'opacity')
+
+# How many style properties were set on a terminal, how many were
+# skipped because the terminal already had the value and how many were
+# kept for later because the terminal was not shown
+style_stats = {'applied': 0, 'skipped': 0, 'deferred': 0}
 
 
 # regular expressions to highlight links in terminal. This code was
@@ -76,6 +91,21 @@ QUICK_OPEN_MATCHERS = [
 ]
 
 
+def get_style_stats():
+    return dict(style_stats)
+
+
+def style_key(value):
+    """Returns something comparable standing for a style value, colors
+    and fonts are compared by their string form.
+    """
+    if isinstance(value, (gtk.gdk.Color, pango.FontDescription)):
+        return value.to_string()
+    if isinstance(value, (tuple, list)):
+        return tuple(style_key(v) for v in value)
+    return value
+
+
 class GuakeTerminal(vte.Terminal):
 
     """Just a vte.Terminal with some properties already set.
@@ -83,9 +113,14 @@ class GuakeTerminal(vte.Terminal):
 
     def __init__(self):
         super(GuakeTerminal, self).__init__()
+        # style property -> style_key() of the value the terminal has
+        self.applied_style = {}
+        # style properties waiting for the terminal to be shown
+        self.pending_style = {}
         self.configure_terminal()
         self.add_matches()
         self.connect('button-press-event', self.button_press)
+        self.connect('map', self.on_map)
         self.matched_value = ''
         self.font_scale_index = 0
         self.pid = None
@@ -103,19 +138,101 @@ class GuakeTerminal(vte.Terminal):
     def configure_terminal(self):
         """Sets all customized properties on the terminal
         """
-        client = gconf.client_get_default()
-        word_chars = client.get_string(KEY('/general/word_chars'))
+        settings = get_settings()
+        word_chars = settings.general.word_chars
         if word_chars:
             self.set_word_chars(word_chars)
-        self.set_audible_bell(client.get_bool(KEY('/general/use_audible_bell')))
-        self.set_visible_bell(client.get_bool(KEY('/general/use_visible_bell')))
+        self.set_audible_bell(settings.general.use_audible_bell)
+        self.set_visible_bell(settings.general.use_visible_bell)
         self.set_sensitive(True)
         self.set_flags(gtk.CAN_DEFAULT)
         self.set_flags(gtk.CAN_FOCUS)
-        cursor_blink_mode = client.get_int(KEY('/style/cursor_blink_mode'))
-        client.set_int(KEY('/style/cursor_blink_mode'), cursor_blink_mode)
-        cursor_shape = client.get_int(KEY('/style/cursor_shape'))
-        client.set_int(KEY('/style/cursor_shape'), cursor_shape)
+        self.apply_style({
+            'cursor_blink_mode': settings.style.cursor_blink_mode,
+            'cursor_shape': settings.style.cursor_shape,
+        })
+
+    def apply_style(self, profile):
+        """Applies the style properties of the `profile' dict, which
+        holds any of STYLE_PROPERTIES. Only the vte setters of the values
+        that differ from what the terminal already has are called, as
+        each of them redraws the whole terminal. The palette is applied
+        with the `fgcolor' and `bgcolor' of the profile.
+        """
+        applied_style = self.applied_style
+        for name in STYLE_PROPERTIES:
+            if name not in profile:
+                continue
+            value = profile[name]
+            key = style_key(value)
+            if applied_style.get(name) == key:
+                style_stats['skipped'] += 1
+                continue
+            style_stats['applied'] += 1
+            applied_style[name] = key
+            if name == 'font':
+                self.font = value
+                self.font_name = key
+                scale_index = profile.get('font_scale', 0)
+                self.set_font_scale_index(scale_index)
+                applied_style['font_scale'] = scale_index
+            elif name == 'font_scale':
+                self.set_font_scale_index(value)
+            elif name == 'palette':
+                self.set_colors(profile.get('fgcolor'), profile.get('bgcolor'), value[:16])
+                # set_colors() also changed these
+                applied_style.pop('fgcolor', None)
+                applied_style.pop('bgcolor', None)
+            elif name == 'fgcolor':
+                self.set_color_dim(value)
+                self.set_color_foreground(value)
+                self.set_color_bold(value)
+            elif name == 'bgcolor':
+                self.set_color_background(value)
+                self.set_background_tint_color(value)
+            elif name == 'allow_bold':
+                self.set_allow_bold(value)
+            elif name == 'cursor_blink_mode':
+                self.set_property('cursor-blink-mode', value)
+            elif name == 'cursor_shape':
+                self.set_property('cursor-shape', value)
+            elif name == 'scrollback_lines':
+                self.set_scrollback_lines(value)
+            elif name == 'background_image':
+                self.set_background_image_file(value)
+            elif name == 'background_transparent':
+                self.set_background_transparent(value)
+            elif name == 'background_saturation':
+                self.set_background_saturation(value)
+            elif name == 'opacity':
+                self.set_opacity(value)
+
+    def update_style(self, profile):
+        """Applies the style properties of `profile' right away if the
+        terminal is shown. Otherwise they are kept until it is mapped,
+        that is when its tab is selected or the window shown, so hidden
+        tabs cost nothing when the style or the zoom change.
+        """
+        if self.get_mapped():
+            self.apply_style(profile)
+            return
+        style_stats['deferred'] += len(profile)
+        if 'font' in profile and 'font_scale' not in profile:
+            # the new font resets the zoom done meanwhile
+            self.pending_style.pop('font_scale', None)
+        self.pending_style.update(profile)
+
+    def on_map(self, terminal):
+        if self.pending_style:
+            profile, self.pending_style = self.pending_style, {}
+            self.apply_style(profile)
+
+    def invalidate_style(self, names=STYLE_PROPERTIES):
+        """Forgets the style properties `names', so the next
+        apply_style() sets them again.
+        """
+        for name in names:
+            self.applied_style.pop(name, None)
 
     def add_matches(self):
         """Adds all regular expressions declared in
@@ -132,10 +249,9 @@ class GuakeTerminal(vte.Terminal):
 
     def get_current_directory(self):
         directory = os.path.expanduser('~')
-        if self.pid is not None:
-            cwd = os.readlink("/proc/%d/cwd" % self.pid)
-            if os.path.exists(cwd):
-                directory = cwd
+        info = get_process_scanner().get_info(self.pid)
+        if info is not None and os.path.exists(info.cwd):
+            directory = info.cwd
         return directory
 
     def button_press(self, terminal, event):
@@ -154,11 +270,10 @@ class GuakeTerminal(vte.Terminal):
             value, tag = matched_string
             # First searching in additional matchers
             found_additional_matcher = False
-            client = gconf.client_get_default()
-            use_quick_open = client.get_bool(KEY("/general/quick_open_enable"))
-            quick_open_in_current_terminal = client.get_bool(
-                KEY("/general/quick_open_in_current_terminal"))
-            cmdline = client.get_string(KEY("/general/quick_open_command_line"))
+            settings = get_settings()
+            use_quick_open = settings.general.quick_open_enable
+            quick_open_in_current_terminal = settings.general.quick_open_in_current_terminal
+            cmdline = settings.general.quick_open_command_line
             if use_quick_open:
                 for _useless, _otheruseless, extractor in QUICK_OPEN_MATCHERS:
                     g = re.compile(extractor).match(value)
@@ -244,26 +359,23 @@ class GuakeTerminal(vte.Terminal):
         subprocess.Popen(cmd, shell=False)
 
     def set_font(self, font):
-        self.font = font
-        self.set_font_scale_index(0)
+        """Goes through update_style, so the applied style follows the
+        font and the zoom it resets.
+        """
+        self.update_style({'font': font})
 
     def set_font_scale_index(self, scale_index):
-        self.font_scale_index = clamp(scale_index, -6, 12)
-
-        font = pango.FontDescription(self.font.to_string())
-        scale_factor = 2 ** (self.font_scale_index / 6)
-        new_size = int(scale_factor * font.get_size())
+        self.font_scale_index = clamp(scale_index, MIN_FONT_SCALE, MAX_FONT_SCALE)
+        super(GuakeTerminal, self).set_font(get_scaled_font(self.font_name,
+                                                            self.font_scale_index))
 
-        if font.get_size_is_absolute():
-            font.set_absolute_size(new_size)
-        else:
-            font.set_size(new_size)
-
-        super(GuakeTerminal, self).set_font(font)
+    def get_font_scale(self):
+        return self.pending_style.get('font_scale', self.font_scale_index)
 
     font_scale = property(
-        fset=set_font_scale_index,
-        fget=lambda self: self.font_scale_index
+        fset=lambda self, scale_index: self.update_style(
+            {'font_scale': clamp(scale_index, MIN_FONT_SCALE, MAX_FONT_SCALE)}),
+        fget=get_font_scale
     )
 
     def increase_font_size(self):
@@ -273,42 +385,13 @@ class GuakeTerminal(vte.Terminal):
         self.font_scale -= 1
 
     def kill(self):
-        pid = self.get_pid()
-        start_new_thread(self.delete_shell, (pid,))
-
-    def delete_shell(self, pid):
-        """This function will kill the shell on a tab, trying to send
-        a sigterm and if it doesn't work, a sigkill. Between these two
-        signals, we have a timeout of 3 seconds, so is recommended to
-        call this in another thread. This doesn't change any thing in
-        UI, so you can use python's start_new_thread.
+        """Kills the shell of the terminal, sending a SIGHUP and, if it
+        does not exit within a few seconds, a SIGKILL. It does not block,
+        the shell is left to the shell reaper.
         """
-        try:
-            os.kill(pid, signal.SIGHUP)
-        except OSError:
-            pass
-        num_tries = 30
-
-        while num_tries > 0:
-            try:
-                # Try to wait for the pid to be closed. If it does not
-                # exist anymore, an OSError is raised and we can
-                # safely ignore it.
-                if os.waitpid(pid, os.WNOHANG)[0] != 0:
-                    break
-            except OSError:
-                break
-            sleep(0.1)
-            num_tries -= 1
-
-        if num_tries == 0:
-            try:
-                os.kill(pid, signal.SIGKILL)
-                os.waitpid(pid, 0)
-            except OSError:
-                # if this part of code was reached, means that SIGTERM
-                # did the work and SIGKILL wasnt needed.
-                pass
+        pid = self.get_pid()
+        if pid is not None:
+            get_shell_reaper().reap(pid)
 
 
 class GuakeTerminalBox(gtk.HBox):
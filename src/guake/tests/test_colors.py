@@ -0,0 +1,60 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+
+import os
+import unittest
+
+try:
+    import gtk
+except ImportError:
+    gtk = None
+
+
+@unittest.skipIf(gtk is None or not os.environ.get('DISPLAY'),
+                 "needs gtk and a X display, use xvfb-run")
+class TestCustomColors(unittest.TestCase):
+
+    def setUp(self):
+        from guake.benchmarks.helpers import create_guake
+        self.guake = create_guake()
+        self.terminal = self.guake.notebook.get_current_terminal()
+
+    def tearDown(self):
+        self.guake.window.destroy()
+
+    def get_style(self, name):
+        # the terminal may not be shown, then the style waits in
+        # pending_style until it is
+        style = self.terminal.pending_style
+        if name in style:
+            return style[name].to_string()
+        return self.terminal.applied_style.get(name)
+
+    def testSetBgcolor(self):
+        self.guake.set_bgcolor('#123456')
+        self.assertEqual(self.get_style('bgcolor'), gtk.gdk.color_parse('#123456').to_string())
+
+    def testSetFgcolor(self):
+        self.guake.set_fgcolor('#654321')
+        self.assertEqual(self.get_style('fgcolor'), gtk.gdk.color_parse('#654321').to_string())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+try:
+    from guake.common import ExecutableIndex
+except ImportError:
+    # guake.common needs gtk and gconf
+    ExecutableIndex = None
+
+
+@unittest.skipIf(ExecutableIndex is None, "needs gtk and gconf")
+class TestExecutableIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name in ('vim', 'vimdiff', 'zsh'):
+            self.touch(name)
+        self.path = os.environ.get('PATH')
+        os.environ['PATH'] = self.directory
+        self.index = ExecutableIndex()
+
+    def tearDown(self):
+        if self.path is None:
+            del os.environ['PATH']
+        else:
+            os.environ['PATH'] = self.path
+        shutil.rmtree(self.directory)
+
+    def touch(self, name):
+        open(os.path.join(self.directory, name), 'w').close()
+
+    def expected(self, *names):
+        return [os.path.join(self.directory, name) for name in names]
+
+    def testSearchPrefix(self):
+        self.assertEqual(self.index.search_prefix('vim'), self.expected('vim', 'vimdiff'))
+        self.assertEqual(self.index.search_prefix('emacs'), [])
+
+    def testSearch(self):
+        self.assertEqual(self.index.search(re.compile(r'.*sh$')), self.expected('zsh'))
+        self.assertEqual(self.index.search(re.compile('emacs')), [])
+
+    def testListedAgainWhenMtimeChanges(self):
+        self.assertEqual(self.index.search_prefix('bash'), [])
+        self.touch('bash')
+        # make sure the mtime changed even on a coarse-grained filesystem
+        mtime = os.stat(self.directory).st_mtime
+        os.utime(self.directory, (mtime + 10, mtime + 10))
+        self.assertEqual(self.index.search_prefix('bash'), self.expected('bash'))
+
+    def testCachedWhileMtimeIsUnchanged(self):
+        os.utime(self.directory, (1000000000, 1000000000))
+        self.index.search_prefix('vim')
+        self.touch('bash')
+        os.utime(self.directory, (1000000000, 1000000000))
+        self.assertEqual(self.index.search_prefix('bash'), [])
+
+    def testMissingAndUnreadableDirectories(self):
+        not_a_directory = os.path.join(self.directory, 'zsh')
+        missing = os.path.join(self.directory, 'missing')
+        os.environ['PATH'] = os.pathsep.join((missing, not_a_directory, self.directory))
+        self.assertEqual(self.index.search_prefix('vim'), self.expected('vim', 'vimdiff'))
+        self.assertEqual(self.index.list_directory(missing), [])
+        self.assertEqual(self.index.list_directory(not_a_directory), [])
+
+if __name__ == '__main__':
+    unittest.main()
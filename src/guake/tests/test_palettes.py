@@ -0,0 +1,66 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+
+import os
+import unittest
+
+from guake import palettes
+from guake.palettes import PALETTES_FILE
+from guake.palettes import load_palettes
+from guake.palettes import parse_color
+from guake.palettes import parse_palette
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'data')
+
+
+class TestPalettes(unittest.TestCase):
+
+    def testParseColor(self):
+        self.assertEqual(parse_color('#FFFF00008080'), (0xffff, 0, 0x8080))
+        # short forms are scaled like gtk.gdk.color_parse does
+        self.assertEqual(parse_color('#ff0080'), (0xffff, 0, 0x8080))
+        self.assertEqual(parse_color('#f08'), (0xffff, 0, 0x8888))
+        self.assertRaises(ValueError, parse_color, 'red')
+        self.assertRaises(ValueError, parse_color, '#12345')
+
+    def testParsePaletteIsMemoized(self):
+        palette = '#000000:#ff0000:#00ff00'
+        colors = parse_palette(palette)
+        self.assertEqual(colors, ((0, 0, 0), (0xffff, 0, 0), (0, 0xffff, 0)))
+        self.assertIs(parse_palette(palette), colors)
+
+    def testParsedPalettesAreBounded(self):
+        first = '#000000:#000001'
+        parse_palette(first)
+        for i in range(palettes.PARSED_PALETTES_CACHE_SIZE):
+            parse_palette('#000000:#%06x' % (i + 2))
+        self.assertEqual(len(palettes._parsed_palettes), palettes.PARSED_PALETTES_CACHE_SIZE)
+        # the oldest palette was evicted
+        self.assertNotIn(first, palettes._parsed_palettes)
+
+    def testAllPalettesParse(self):
+        palettes = load_palettes(os.path.join(DATA_DIR, PALETTES_FILE))
+        self.assertIn('Zenburn', palettes)
+        for palette in palettes.values():
+            self.assertIn(len(parse_palette(palette)), (16, 18))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8; -*-
+"""
+Copyright (C) 2007-2013 Guake authors
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License as
+published by the Free Software Foundation; either version 2 of the
+License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor,
+Boston, MA 02110-1301 USA
+"""
+from __future__ import absolute_import
+
+import os
+import subprocess
+import unittest
+
+from guake.procinfo import ProcessScanner
+
+
+class TestProcessScanner(unittest.TestCase):
+
+    def testScanOwnProcess(self):
+        pid = os.getpid()
+        child = subprocess.Popen(['sleep', '10'])
+        try:
+            scanner = ProcessScanner()
+            scanner.watch(pid)
+            info = scanner.get_info(pid)
+            self.assertEqual(info.cwd, os.getcwd())
+            self.assertEqual(info.pgid, os.getpgrp())
+            self.assertTrue(info.children >= 1)
+        finally:
+            child.kill()
+            child.wait()
+
+    def testCachedUntilInvalidated(self):
+        pid = os.getpid()
+        scanner = ProcessScanner(ttl=60)
+        scanner.watch(pid)
+        info = scanner.get_info(pid)
+        self.assertIs(scanner.get_info(pid), info)
+        scanner.invalidate(pid)
+        self.assertIsNot(scanner.get_info(pid), info)
+        info = scanner.get_info(pid)
+        scanner.invalidate()
+        self.assertIsNot(scanner.get_info(pid), info)
+
+    def testDeadProcess(self):
+        child = subprocess.Popen(['true'])
+        child.wait()
+        scanner = ProcessScanner()
+        scanner.watch(child.pid)
+        self.assertIsNone(scanner.get_info(child.pid))
+
+if __name__ == '__main__':
+    unittest.main()